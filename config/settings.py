@@ -17,6 +17,9 @@ class BrowserConfig:
     args: List[str] = field(default_factory=list)  # Additional browser launch
     channel: Optional[str] = None  # Chrome channel: 'chrome', 'chrome-beta', 'msedge', etc.
     executable_path: Optional[str] = None  # Custom browser executable path
+    # Abort image/media/font/analytics requests at context level. Faster page loads, but
+    # screenshots and failure reports then show pages without images; EBAY_BLOCK_RESOURCES=1 enables
+    block_resources: bool = os.getenv("EBAY_BLOCK_RESOURCES", "0") == "1"
 
 
 @dataclass
@@ -58,6 +61,10 @@ class ReportConfig:
     html_report_path: Path = Path("reports/html-report")
     screenshot_on_failure: bool = True
     generate_unique_report_dir: bool = True
+    # Success-path screenshots (slow PNG encode on the hot path); EBAY_SCREENSHOTS=1 enables
+    screenshot_on_success: bool = os.getenv("EBAY_SCREENSHOTS", "0") == "1"
+    # "off", "failure" or "always" for BasePage.capture_screenshot; --screenshot-mode overrides
+    screenshot_mode: str = "always" if os.getenv("EBAY_SCREENSHOTS", "0") == "1" else "failure"
 
 
 @dataclass
@@ -67,6 +74,9 @@ class ParallelConfig:
     enable_parallel: bool = True
     max_workers: int = 4
     session_isolation: bool = True
+    # Pages loading ahead in add_items_to_cart / search pagination; EBAY_*_CONCURRENCY overrides
+    add_to_cart_concurrency: int = int(os.getenv("EBAY_ADD_TO_CART_CONCURRENCY", "3"))
+    search_page_concurrency: int = int(os.getenv("EBAY_SEARCH_PAGE_CONCURRENCY", "3"))
 
 
 @dataclass
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import Generator
+from typing import Dict, Generator, Optional, Tuple
 
 import pytest
 from playwright.sync_api import Browser, BrowserContext, Page
@@ -26,6 +26,12 @@ def pytest_configure(config):
         allure_dir.mkdir(parents=True, exist_ok=True)
         config.option.allure_report_dir = str(allure_dir)
 
+    # --screenshot-mode wins over the EBAY_SCREENSHOTS default
+    screenshot_mode = config.getoption("--screenshot-mode", default=None)
+    if screenshot_mode:
+        settings.REPORT.screenshot_mode = screenshot_mode
+        settings.REPORT.screenshot_on_success = screenshot_mode == "always"
+
     # Register custom markers
     config.addinivalue_line("markers", "browser(name): specify browser for test")
     config.addinivalue_line("markers", "slow: mark test as slow running")
@@ -52,6 +58,14 @@ def pytest_addoption(parser):
         # Option already exists
         pass
 
+    parser.addoption(
+        "--screenshot-mode",
+        action="store",
+        default=None,
+        choices=("off", "failure", "always"),
+        help="Page screenshots to keep: off, failure (default) or always",
+    )
+
 
 @pytest.fixture(scope="session")
 def browser_factory() -> Generator[BrowserFactory, None, None]:
@@ -63,6 +77,63 @@ def browser_factory() -> Generator[BrowserFactory, None, None]:
     factory.shutdown()
 
 
+def _session_options(browser_name: str, headless: bool, request) -> Dict:
+    """Browser options for create_session, shared by test sessions and the warm-up."""
+    slow_mo = getattr(request.config.option, "slow_mo", 0)
+    return {
+        "browser_name": browser_name,
+        "headless": headless,
+        "extra_args": [] if slow_mo == 0 else None,
+    }
+
+
+@pytest.fixture(scope="session")
+def _ebay_storage_states() -> Dict[Tuple[str, bool], Optional[str]]:
+    """Captured storage state paths, keyed by (browser_name, headless)."""
+    return {}
+
+
+@pytest.fixture
+def ebay_storage_state(
+    browser_factory: BrowserFactory,
+    browser_name: str,
+    headless: bool,
+    _ebay_storage_states: Dict[Tuple[str, bool], Optional[str]],
+    tmp_path_factory,
+    request,
+) -> Optional[str]:
+    """
+    Cookies and localStorage from one identified eBay home page visit.
+
+    Captured the first time a browser-backed test needs it, once per browser
+    and headless mode per session (per xdist worker), with the same options
+    as that test's session, and used to seed every later context. No cart
+    exists yet at capture time, so carts stay per test.
+    Returns None (fresh contexts) if the warm-up visit fails.
+    """
+    key = (browser_name, headless)
+    if key in _ebay_storage_states:
+        return _ebay_storage_states[key]
+
+    from pages.home_page import HomePage
+
+    _ebay_storage_states[key] = None
+    state_path = tmp_path_factory.mktemp("ebay_state") / "storage_state.json"
+    options = _session_options(browser_name, headless, request)
+    try:
+        with browser_factory.session(**options) as session:
+            home_page = HomePage(session.page)
+            home_page.navigate()
+            if not home_page.identification():
+                return None
+            session.context.storage_state(path=str(state_path))
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not capture eBay storage state: {e}")
+        return None
+    _ebay_storage_states[key] = str(state_path)
+    return str(state_path)
+
+
 @pytest.fixture(scope="session")
 def base_url(request) -> str:
     """Get base URL for tests."""
@@ -92,18 +163,22 @@ def headless(request) -> bool:
 
 @pytest.fixture
 def browser_session(
-    browser_factory: BrowserFactory, browser_name: str, headless: bool, request
+    browser_factory: BrowserFactory,
+    browser_name: str,
+    headless: bool,
+    ebay_storage_state: Optional[str],
+    request,
 ) -> Generator[BrowserSession, None, None]:
     """
     Function-scoped browser session.
-    Each test gets an isolated browser session.
+    Each test gets an isolated browser session, seeded with the shared
+    eBay storage state.
     """
     slow_mo = getattr(request.config.option, "slow_mo", 0)
 
     session = browser_factory.create_session(
-        browser_name=browser_name,
-        headless=headless,
-        extra_args=[] if slow_mo == 0 else None,
+        **_session_options(browser_name, headless, request),
+        storage_state=ebay_storage_state,
     )
 
     # Update slow_mo if needed
@@ -150,7 +225,11 @@ def screenshot_on_failure(page: Page, request):
     yield
 
     # Capture screenshot if test failed
-    if request.node.rep_call and request.node.rep_call.failed:
+    if (
+        request.node.rep_call
+        and request.node.rep_call.failed
+        and settings.REPORT.screenshot_mode != "off"
+    ):
         capture_failure_screenshot(page, request.node.name)
 
 
@@ -7,19 +7,85 @@ Provides common functionality for all page objects.
 import logging
 from abc import ABC
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Set
+from weakref import WeakSet
 
 from playwright.sync_api import Locator, Page, Response
 
 from config.settings import settings
 from core.retry_handler import RetryHandler
 from core.smart_locator import (
+    ElementNotFoundError,
     LocatorResolutionResult,
+    LocatorType,
     SmartLocator,
     SmartLocatorResolver,
 )
 from core.wait_handler import WaitCondition, WaitHandler
 
+# Evaluates groups of [type, selector] strategies in the browser and reports,
+# per group, whether any strategy matches a rendered, visible element.
+_VISIBILITY_SNAPSHOT_JS = """
+(groups) => groups.map(strategies => strategies.some(([type, value]) => {
+    let nodes;
+    try {
+        if (type === 'xpath') {
+            const snapshot = document.evaluate(
+                value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            nodes = Array.from(
+                {length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i)
+            );
+        } else {
+            nodes = Array.from(document.querySelectorAll(value));
+        }
+    } catch (e) {
+        return false;
+    }
+    return nodes.some(el => el.getClientRects && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden');
+}))
+"""
+
+
+# Init script maintaining window.__locatorIndex: data-test-id -> element.
+# Built once per document and kept current by a MutationObserver, so reading
+# an element by test id never goes through the selector engine.
+_TEST_ID_INDEX_JS = """
+(() => {
+    if (window.__locatorIndex) return;
+    window.__locatorIndex = {};
+    const register = el => {
+        const id = el.getAttribute && el.getAttribute('data-test-id');
+        if (id) window.__locatorIndex[id] = el;
+    };
+    const scan = root => {
+        register(root);
+        if (root.querySelectorAll) root.querySelectorAll('[data-test-id]').forEach(register);
+    };
+    new MutationObserver(mutations => mutations.forEach(m => m.addedNodes.forEach(
+        node => node.nodeType === 1 && scan(node)
+    ))).observe(document.documentElement, {subtree: true, childList: true});
+    scan(document.documentElement);
+})();
+"""
+
+# Reads an element's text by data-test-id, preferring the index and falling
+# back to a direct query when the index is missing or the entry is stale.
+_TEXT_BY_TEST_ID_JS = """
+(id) => {
+    const index = window.__locatorIndex;
+    let el = index && index[id];
+    if (!el || !el.isConnected) {
+        el = document.querySelector(`[data-test-id="${CSS.escape(id)}"]`);
+    }
+    return el ? el.textContent : null;
+}
+"""
+
+# Pages that already carry the index init script
+_indexed_pages: "WeakSet[Page]" = WeakSet()
+
 
 class BasePage(ABC):
     """
@@ -43,23 +109,39 @@ class BasePage(ABC):
         # Screenshot counter for this page instance
         self._screenshot_counter = 0
 
+        # data-test-id values present on the current document (see _discover_test_ids)
+        self._test_ids: Optional[Set[str]] = None
+        self._test_ids_url: Optional[str] = None
+        self._install_test_id_index()
+
+        # Successful resolutions on the current document, keyed by id(SmartLocator)
+        self._locator_cache: Dict[int, LocatorResolutionResult] = {}
+
+        # Raw-selector Locators; they query lazily, so they survive navigation
+        self._page_locators: Dict[str, Locator] = {}
+
         self.logger.debug(f"Initialized {self.PAGE_NAME}")
 
     # ==================== Navigation ====================
 
-    def navigate(self, url: str = None) -> Optional[Response]:
+    def navigate(self, url: str = None, wait_until: str = "load") -> Optional[Response]:
         """
 
         Args:
             url: URL to navigate to (uses PAGE_URL if not provided)
+            wait_until: Load state to wait for ("load", "domcontentloaded", "commit")
         """
         target_url = url or self.PAGE_URL
         if not target_url:
             raise ValueError(f"No URL provided for {self.PAGE_NAME}")
 
         self.logger.info(f"Navigating to: {target_url}")
-        response = self.page.goto(target_url)
-        self._wait_handler.wait_for_page_load()
+        self._reset_document_caches()
+        if wait_until == "load":
+            response = self.page.goto(target_url)
+            self._wait_handler.wait_for_page_load()
+        else:
+            response = self.page.goto(target_url, wait_until=wait_until)
         return response
 
     def navigate_to_base_url(self) -> Optional[Response]:
@@ -69,23 +151,57 @@ class BasePage(ABC):
     def refresh(self) -> None:
         """Refresh the current page."""
         self.logger.debug(f"Refreshing {self.PAGE_NAME}")
+        self._reset_document_caches()
         self.page.reload()
         self._wait_handler.wait_for_page_load()
 
     def go_back(self) -> None:
         """Navigate back in browser history."""
         self.logger.debug("Navigating back")
+        self._reset_document_caches()
         self.page.go_back()
         self._wait_handler.wait_for_page_load()
 
     def go_forward(self) -> None:
         """Navigate forward in browser history."""
         self.logger.debug("Navigating forward")
+        self._reset_document_caches()
         self.page.go_forward()
         self._wait_handler.wait_for_page_load()
 
+    def _reset_document_caches(self) -> None:
+        """Forget everything cached about the current document before leaving it."""
+        self._test_ids = None
+        self._locator_cache.clear()
+
     # ==================== Smart Locator Methods ====================
 
+    def _resolve(
+        self, smart_locator: SmartLocator, wait_visible: bool = True
+    ) -> LocatorResolutionResult:
+        """
+        Resolve a smart locator, reusing the strategy that matched earlier on this page.
+
+        A cached resolution is only reused while its element is still attached
+        (and visible, if required); otherwise the full fallback chain runs again.
+        """
+        key = id(smart_locator)
+        cached = self._locator_cache.get(key)
+        if cached is not None:
+            try:
+                locator = cached.playwright_locator
+                if locator.count() > 0 and (
+                    not wait_visible or locator.first.is_visible()
+                ):
+                    return cached
+            except Exception:
+                pass
+
+        result = self._locator_resolver.resolve(smart_locator, wait_visible)
+        if result.success:
+            self._locator_cache[key] = result
+        return result
+
     def find_element(
         self, smart_locator: SmartLocator, wait_visible: bool = True
     ) -> Locator:
@@ -95,7 +211,14 @@ class BasePage(ABC):
             Playwright Locator
 
         """
-        return self._locator_resolver.find_element(smart_locator, wait_visible)
+        result = self._resolve(smart_locator, wait_visible)
+        if not result.success:
+            raise ElementNotFoundError(
+                f"Could not find element '{smart_locator.name}' "
+                f"after {result.total_attempts} attempts. "
+                f"Screenshot: {result.screenshot_path}"
+            )
+        return result.playwright_locator
 
     def find_element_safe(
         self, smart_locator: SmartLocator, wait_visible: bool = True
@@ -106,7 +229,7 @@ class BasePage(ABC):
         Returns:
             Playwright Locator or None if not found
         """
-        result = self._locator_resolver.resolve(smart_locator, wait_visible)
+        result = self._resolve(smart_locator, wait_visible)
         return result.playwright_locator if result.success else None
 
     def resolve_locator(
@@ -117,7 +240,45 @@ class BasePage(ABC):
         Returns:
             LocatorResolutionResult with all attempt details
         """
-        return self._locator_resolver.resolve(smart_locator, wait_visible)
+        return self._resolve(smart_locator, wait_visible)
+
+    def _install_test_id_index(self) -> None:
+        """Register the data-test-id index init script once per Playwright page."""
+        if self.page in _indexed_pages:
+            return
+        try:
+            self.page.add_init_script(_TEST_ID_INDEX_JS)
+            _indexed_pages.add(self.page)
+        except Exception as e:
+            self.logger.debug(f"Could not install data-test-id index: {e}")
+
+    def get_text_by_test_id(self, test_id: str) -> Optional[str]:
+        """
+        Get text content of the element with the given data-test-id.
+
+        Returns:
+            Text content or None if no such element exists
+        """
+        return self.page.evaluate(_TEXT_BY_TEST_ID_JS, test_id)
+
+    def _discover_test_ids(self) -> Set[str]:
+        """
+        Get the set of data-test-id values present on the current document.
+
+        Collected with a single page.evaluate and cached until the page
+        navigates, so locators keyed on a data-test-id can be skipped
+        outright when the id is absent.
+        """
+        url = self.page.url
+        if self._test_ids is None or self._test_ids_url != url:
+            self._test_ids = set(
+                self.page.evaluate(
+                    "() => [...document.querySelectorAll('[data-test-id]')]"
+                    ".map(e => e.getAttribute('data-test-id'))"
+                )
+            )
+            self._test_ids_url = url
+        return self._test_ids
 
     def is_element_present(
         self, smart_locator: SmartLocator, timeout: int = 5000
@@ -132,13 +293,44 @@ class BasePage(ABC):
         Returns:
             True if element exists
         """
-        original_timeout = smart_locator.timeout
-        smart_locator.timeout = timeout
+        cached = self._locator_cache.get(id(smart_locator))
+        if cached is not None:
+            try:
+                if cached.playwright_locator.count() > 0:
+                    return True
+            except Exception:
+                pass
+
+        # All strategies raced in one wait instead of one timeout per strategy
+        try:
+            smart_locator.as_or_locator(self.page).first.wait_for(
+                state="attached", timeout=timeout
+            )
+            return True
+        except Exception:
+            return False
 
-        result = self._locator_resolver.resolve(smart_locator, wait_for_visible=False)
+    def page_locator(self, selector: str) -> Locator:
+        """Get the Locator for a fixed selector, built once per page object."""
+        locator = self._page_locators.get(selector)
+        if locator is None:
+            locator = self.page.locator(selector)
+            self._page_locators[selector] = locator
+        return locator
 
-        smart_locator.timeout = original_timeout
-        return result.success
+    def is_element_in_dom(self, smart_locator: SmartLocator) -> bool:
+        """
+        Check if any strategy matches the current DOM, without waiting.
+
+        Use once the page (or the region holding the element) has loaded.
+
+        Returns:
+            True if at least one element matches
+        """
+        try:
+            return smart_locator.as_or_locator(self.page).count() > 0
+        except Exception:
+            return False
 
     def is_element_visible(
         self, smart_locator: SmartLocator, timeout: int = 5000
@@ -149,13 +341,55 @@ class BasePage(ABC):
         Returns:
             True if element is visible
         """
+        # Locators may be shared across page objects, so always restore
         original_timeout = smart_locator.timeout
         smart_locator.timeout = timeout
+        try:
+            result = self._resolve(smart_locator, wait_visible=True)
+        finally:
+            smart_locator.timeout = original_timeout
+        return result.success
 
-        result = self._locator_resolver.resolve(smart_locator, wait_for_visible=True)
+    def get_visibility_snapshot(
+        self, smart_locators: List[SmartLocator]
+    ) -> Dict[str, bool]:
+        """
+        Check visibility of several elements in a single page.evaluate.
 
-        smart_locator.timeout = original_timeout
-        return result.success
+        Does not wait: the result reflects the DOM at call time, so call it
+        once the page is known to be rendered. Only XPath and CSS strategies
+        are evaluated in the browser; locators without any fall back to
+        is_element_visible.
+
+        Returns:
+            Dict mapping SmartLocator name to visibility
+        """
+        # Only the strategies the resolver would try, so no fallback counts
+        # here that is_element_visible would never reach
+        max_strategies = settings.LOCATOR.max_locator_retries
+        browser_side = [
+            loc
+            for loc in smart_locators
+            if any(
+                d.locator_type in (LocatorType.XPATH, LocatorType.CSS)
+                for d in loc.locators[:max_strategies]
+            )
+        ]
+        groups = [
+            [
+                [d.locator_type.value, d.value]
+                for d in loc.locators[:max_strategies]
+                if d.locator_type in (LocatorType.XPATH, LocatorType.CSS)
+            ]
+            for loc in browser_side
+        ]
+        visible = self.page.evaluate(_VISIBILITY_SNAPSHOT_JS, groups) if groups else []
+
+        snapshot = {loc.name: bool(v) for loc, v in zip(browser_side, visible)}
+        for loc in smart_locators:
+            if loc.name not in snapshot:
+                snapshot[loc.name] = self.is_element_visible(loc)
+        return snapshot
 
     # ==================== Element Interactions ====================
 
@@ -299,6 +533,25 @@ class BasePage(ABC):
         element = self.find_element(smart_locator)
         return element.text_content() or ""
 
+    def get_text_if_present(
+        self, smart_locator: SmartLocator, timeout: int = 5000
+    ) -> Optional[str]:
+        """
+        Get text content of an element if it attaches within timeout.
+
+        Existence check and read are one text_content call across all
+        strategies, instead of is_element_present followed by get_text.
+
+        Returns:
+            Text content or None if no strategy matched in time
+        """
+        try:
+            return smart_locator.as_or_locator(self.page).first.text_content(
+                timeout=timeout
+            )
+        except Exception:
+            return None
+
     def get_inner_text(self, smart_locator: SmartLocator) -> str:
         """Get inner text of an element."""
         element = self.find_element(smart_locator)
@@ -343,16 +596,27 @@ class BasePage(ABC):
         """Wait for network to be idle."""
         self._wait_handler.wait_for_network_idle(timeout)
 
+    def wait_for_dom_ready(self, timeout: int = None) -> None:
+        """Wait for DOM content to be loaded."""
+        self._wait_handler.wait_for_dom_ready(timeout)
+
     def wait_for_url(self, url_pattern: str, timeout: int = None) -> bool:
         """Wait for URL to match pattern."""
         return self._wait_handler.wait_for_url(url_pattern, timeout)
 
     # ==================== Screenshot & Logging ====================
 
-    def capture_screenshot(self, name: str = None, full_page: bool = False) -> str:
+    def capture_screenshot(
+        self, name: str = None, full_page: bool = False, failure: bool = False
+    ) -> Optional[str]:
         """
-        Path to saved screenshot
+        Path to saved screenshot, or None when the screenshot mode skips it
+        ("off" skips all, "failure" skips those not taken with failure=True)
         """
+        mode = settings.REPORT.screenshot_mode
+        if mode == "off" or (mode == "failure" and not failure):
+            return None
+
         settings.ensure_directories()
         self._screenshot_counter += 1
 
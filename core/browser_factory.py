@@ -4,11 +4,10 @@ Ensures session isolation and proper resource cleanup.
 """
 
 import logging
-import os
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Generator, Optional
+from typing import Dict, Generator, Optional, Tuple
 
 from playwright.sync_api import (
     Browser,
@@ -16,11 +15,27 @@ from playwright.sync_api import (
     BrowserType,
     Page,
     Playwright,
+    Route,
     sync_playwright,
 )
 
 from config.settings import BrowserConfig, settings
 
+# Requests no page object reads: images, media, fonts and tracking beacons
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_URL_MARKERS = ("analytics", "doubleclick")
+
+
+def _block_non_essential(route: Route) -> None:
+    """Abort requests for blocked resource types or trackers, let the rest through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        marker in request.url for marker in BLOCKED_URL_MARKERS
+    ):
+        route.abort()
+    else:
+        route.fallback()
+
 
 @dataclass
 class BrowserSession:
@@ -33,6 +48,7 @@ class BrowserSession:
     browser_config: BrowserConfig
     created_at: datetime = field(default_factory=datetime.now)
     trace_path: Optional[str] = None
+    owns_browser: bool = True  # False when the browser is shared by the factory
 
     def close(self) -> None:
         """Close the session and release resources."""
@@ -56,7 +72,7 @@ class BrowserSession:
             pass
 
         try:
-            if self.browser and self.browser.is_connected():
+            if self.owns_browser and self.browser and self.browser.is_connected():
                 self.browser.close()
         except Exception:
             pass
@@ -73,6 +89,8 @@ class BrowserFactory:
         self._playwright: Optional[Playwright] = None
         self._sessions: Dict[str, BrowserSession] = {}
         self._session_counter = 0
+        # Launched browsers shared by sessions, keyed by their launch options
+        self._browsers: Dict[Tuple, Browser] = {}
 
     def _get_playwright(self) -> Playwright:
         """Get or create Playwright instance."""
@@ -94,6 +112,23 @@ class BrowserFactory:
         }
         return browser_map.get(browser_name.lower(), playwright.chromium)
 
+    def _get_browser(self, browser_type: BrowserType, launch_options: Dict) -> Browser:
+        """
+        Get a running browser for these launch options, launching it once.
+
+        Sessions isolate state through their own context, so one browser
+        process per factory (one per pytest-xdist worker) is enough.
+        """
+        key = (
+            browser_type.name,
+            *sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in launch_options.items()),
+        )
+        browser = self._browsers.get(key)
+        if browser is None or not browser.is_connected():
+            browser = browser_type.launch(**launch_options)
+            self._browsers[key] = browser
+        return browser
+
     def _generate_session_id(self, browser_name: str) -> str:
         """Generate unique session ID."""
         self._session_counter += 1
@@ -110,6 +145,7 @@ class BrowserFactory:
         record_video: bool = False,
         record_har: bool = False,
         record_trace: bool = False,
+        block_resources: bool = None,
         **context_options,
     ) -> BrowserSession:
         """
@@ -124,6 +160,8 @@ class BrowserFactory:
             record_video: Whether to record video
             record_har: Whether to record HAR file
             record_trace: Whether to record Playwright trace (captures API calls, screenshots, etc.)
+            block_resources: Abort image/media/font/analytics requests
+                (default from browser config, off unless EBAY_BLOCK_RESOURCES=1)
             **context_options: Additional context options
 
         Returns:
@@ -159,11 +197,11 @@ class BrowserFactory:
         if args:
             launch_options["args"] = args
 
-        # Launch browser
+        # Launch browser, or reuse the one already running with these options
         self.logger.info(
-            f"Launching {browser_name} browser (headless={config.headless})"
+            f"Starting {browser_name} session (headless={config.headless})"
         )
-        browser = browser_type.launch(**launch_options)
+        browser = self._get_browser(browser_type, launch_options)
 
         # Prepare context options
         ctx_options = {
@@ -195,6 +233,11 @@ class BrowserFactory:
         context = browser.new_context(**ctx_options)
         context.set_default_timeout(config.timeout)
 
+        # Routes apply to every page of the context, including pooled pages
+        if config.block_resources if block_resources is None else block_resources:
+            context.route("**/*", _block_non_essential)
+            self.logger.info("Blocking image, media, font and analytics requests")
+
         # Setup Playwright tracing (captures API calls, screenshots, snapshots)
         trace_file_path = None
         if record_trace:
@@ -271,6 +314,7 @@ class BrowserFactory:
             page=page,
             browser_config=config,
             trace_path=trace_file_path,
+            owns_browser=False,
         )
 
         # Track session
@@ -299,6 +343,13 @@ class BrowserFactory:
     def shutdown(self) -> None:
         """Shutdown factory and release all resources."""
         self.close_all_sessions()
+        for browser in self._browsers.values():
+            try:
+                if browser.is_connected():
+                    browser.close()
+            except Exception:
+                pass
+        self._browsers.clear()
         if self._playwright:
             self._playwright.stop()
             self._playwright = None
@@ -3,11 +3,13 @@ Handles multiple locators with automatic fallback, retry logic, and detailed log
 """
 
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
+from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import Locator, Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
@@ -39,6 +41,35 @@ class LocatorDefinition:
         return f"{self.locator_type.value}: {self.value}"
 
 
+def to_playwright_locator(page: Page, locator_def: LocatorDefinition) -> Locator:
+    """Convert a LocatorDefinition to a Playwright Locator."""
+    match locator_def.locator_type:
+        case LocatorType.XPATH:
+            return page.locator(f"xpath={locator_def.value}")
+        case LocatorType.CSS:
+            return page.locator(locator_def.value)
+        case LocatorType.TEXT:
+            return page.get_by_text(locator_def.value)
+        case LocatorType.ROLE:
+            # Role format: "button[name=Submit]" or just "button"
+            parts = locator_def.value.split("[")
+            role = parts[0]
+            if len(parts) > 1:
+                name = parts[1].rstrip("]").split("=")[1]
+                return page.get_by_role(role, name=name)
+            return page.get_by_role(role)
+        case LocatorType.TEST_ID:
+            return page.get_by_test_id(locator_def.value)
+        case LocatorType.LABEL:
+            return page.get_by_label(locator_def.value)
+        case LocatorType.PLACEHOLDER:
+            return page.get_by_placeholder(locator_def.value)
+        case LocatorType.ALT_TEXT:
+            return page.get_by_alt_text(locator_def.value)
+        case _:
+            raise ValueError(f"Unknown locator type: {locator_def.locator_type}")
+
+
 @dataclass
 class SmartLocator:
     """
@@ -49,12 +80,14 @@ class SmartLocator:
     name: str  # Human-readable name for logging
     locators: List[LocatorDefinition] = field(default_factory=list)
     timeout: int = settings.LOCATOR.locator_timeout
+    compiled: Optional[str] = field(default=None, repr=False, compare=False)
 
     def add_locator(
         self, locator_type: LocatorType, value: str, description: str = ""
     ) -> "SmartLocator":
         """Add a locator strategy. Returns self for chaining."""
         self.locators.append(LocatorDefinition(locator_type, value, description))
+        self.compiled = None
         return self
 
     def add_xpath(self, xpath: str, description: str = "") -> "SmartLocator":
@@ -77,6 +110,44 @@ class SmartLocator:
         """Add a test ID locator."""
         return self.add_locator(LocatorType.TEST_ID, test_id, description)
 
+    def compile_union(self) -> Optional[str]:
+        """
+        Merge the strategies the resolver would try into one selector.
+
+        XPaths are joined with '|' and CSS selectors with ',' so the browser
+        checks every alternative in a single query. Mixed or other locator
+        types cannot be merged into one selector string.
+
+        Returns:
+            The union selector (also stored on .compiled), or None
+        """
+        definitions = self.locators[: settings.LOCATOR.max_locator_retries]
+        locator_types = {d.locator_type for d in definitions}
+
+        if locator_types == {LocatorType.XPATH}:
+            self.compiled = "xpath=" + " | ".join(d.value for d in definitions)
+        elif locator_types == {LocatorType.CSS}:
+            self.compiled = ", ".join(d.value for d in definitions)
+        else:
+            self.compiled = None
+        return self.compiled
+
+    def as_or_locator(self, page: Page) -> Locator:
+        """
+        Build one Locator matching any strategy the resolver would try.
+
+        Uses the compiled union selector when available, otherwise chains the
+        strategies with Locator.or_() so the engine checks them all at once.
+        """
+        if self.compiled:
+            return page.locator(self.compiled)
+
+        definitions = self.locators[: settings.LOCATOR.max_locator_retries]
+        combined = to_playwright_locator(page, definitions[0])
+        for locator_def in definitions[1:]:
+            combined = combined.or_(to_playwright_locator(page, locator_def))
+        return combined
+
 
 @dataclass
 class LocatorAttemptResult:
@@ -115,31 +186,7 @@ class SmartLocatorResolver:
 
     def _get_playwright_locator(self, locator_def: LocatorDefinition) -> Locator:
         """Convert a LocatorDefinition to a Playwright Locator."""
-        match locator_def.locator_type:
-            case LocatorType.XPATH:
-                return self.page.locator(f"xpath={locator_def.value}")
-            case LocatorType.CSS:
-                return self.page.locator(locator_def.value)
-            case LocatorType.TEXT:
-                return self.page.get_by_text(locator_def.value)
-            case LocatorType.ROLE:
-                # Role format: "button[name=Submit]" or just "button"
-                parts = locator_def.value.split("[")
-                role = parts[0]
-                if len(parts) > 1:
-                    name = parts[1].rstrip("]").split("=")[1]
-                    return self.page.get_by_role(role, name=name)
-                return self.page.get_by_role(role)
-            case LocatorType.TEST_ID:
-                return self.page.get_by_test_id(locator_def.value)
-            case LocatorType.LABEL:
-                return self.page.get_by_label(locator_def.value)
-            case LocatorType.PLACEHOLDER:
-                return self.page.get_by_placeholder(locator_def.value)
-            case LocatorType.ALT_TEXT:
-                return self.page.get_by_alt_text(locator_def.value)
-            case _:
-                raise ValueError(f"Unknown locator type: {locator_def.locator_type}")
+        return to_playwright_locator(self.page, locator_def)
 
     def _capture_failure_screenshot(self, smart_locator: SmartLocator) -> Optional[str]:
         """Capture screenshot on final locator failure."""
@@ -159,6 +206,27 @@ class SmartLocatorResolver:
             self.logger.warning(f"Failed to capture screenshot: {e}")
             return None
 
+    def _any_attached(self, smart_locator: SmartLocator) -> Optional[bool]:
+        """
+        Wait once for any strategy of a SmartLocator to be attached.
+
+        Returns False when none attached in time, and None when the combined
+        query itself fails (e.g. one invalid selector), leaving the
+        strategies to the per-strategy waits.
+        """
+        try:
+            smart_locator.as_or_locator(self.page).first.wait_for(
+                state="attached", timeout=smart_locator.timeout
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
+        except PlaywrightError as e:
+            self.logger.debug(
+                f"Combined wait failed for '{smart_locator.name}', trying strategies: {e}"
+            )
+            return None
+
     def resolve(
         self, smart_locator: SmartLocator, wait_for_visible: bool = True
     ) -> LocatorResolutionResult:
@@ -186,6 +254,25 @@ class SmartLocatorResolver:
             len(smart_locator.locators), settings.LOCATOR.max_locator_retries
         )
 
+        # One query for every strategy: if none is even attached, skip the
+        # per-strategy waits that would each run out their full timeout
+        timeout = smart_locator.timeout
+        attached = None
+        if max_attempts > 1:
+            started = time.monotonic()
+            attached = self._any_attached(smart_locator)
+            if attached is False:
+                self.logger.warning(
+                    f"FAILED: SmartLocator '{smart_locator.name}' - "
+                    f"no strategy matched within {smart_locator.timeout}ms"
+                )
+                result.total_attempts = max_attempts
+                result.screenshot_path = self._capture_failure_screenshot(smart_locator)
+                return result
+            # The pre-wait comes out of the budget (0 would mean no timeout)
+            elapsed_ms = (time.monotonic() - started) * 1000
+            timeout = max(smart_locator.timeout - elapsed_ms, 1)
+
         self.logger.info(
             f"Resolving SmartLocator '{smart_locator.name}' - "
             f"{len(smart_locator.locators)} locators available, "
@@ -210,14 +297,17 @@ class SmartLocatorResolver:
             try:
                 playwright_locator = self._get_playwright_locator(locator_def)
 
+                # With the union attached, strategies with no match are
+                # skipped on a zero-wait count instead of a wait each
+                if attached and playwright_locator.count() == 0:
+                    attempt_result.error_message = "Not attached"
+                    result.attempts.append(attempt_result)
+                    continue
+
                 if wait_for_visible:
-                    playwright_locator.wait_for(
-                        state="visible", timeout=smart_locator.timeout
-                    )
+                    playwright_locator.wait_for(state="visible", timeout=timeout)
                 else:
-                    playwright_locator.wait_for(
-                        state="attached", timeout=smart_locator.timeout
-                    )
+                    playwright_locator.wait_for(state="attached", timeout=timeout)
 
                 # Verify element count (at least one element found)
                 if playwright_locator.count() > 0:
@@ -1,103 +1,126 @@
-from playwright.sync_api import Page
+from typing import Dict
 
 from core.base_page import BasePage
 from core.smart_locator import SmartLocator
 from utils.allure_helper import allure_step
 
 
+def _build_locators() -> Dict[str, SmartLocator]:
+    """Build the home page locator table, shared by every HomePage."""
+    # ---- Search Input Field
+    SEARCH_INPUT = SmartLocator(name="Search Input")
+    # XPath by ID
+
+    SEARCH_INPUT.add_xpath("//input[@id='gh-ac']", "XPath - ID based")
+
+    # XPath by placeholder
+    SEARCH_INPUT.add_xpath(
+        "//input[@placeholder='Search for anything']", "XPath - placeholder"
+    )
+
+    # CSS by attribute
+    SEARCH_INPUT.add_css(
+        "input[type='text'][name='_nkw']", "CSS - attribute selector"
+    )
+
+    # --- Search Button
+    SEARCH_BUTTON = SmartLocator(name="Search Button")
+    # XPath by text
+    SEARCH_BUTTON.add_xpath("//button[text()='Search']", "text")
+    # XPath by aria-label
+    SEARCH_BUTTON.add_xpath("//button[contains(@aria-label, 'Search')]", "aria-label")
+    # CSS by type
+    SEARCH_BUTTON.add_css("button[type='submit']", "type")
+    # XPath by class
+    SEARCH_BUTTON.add_xpath("//button[contains(@class, 'btn')]", "class")
+    # XPath fallback
+    SEARCH_BUTTON.add_xpath("//form[@role='search']//button", "form button")
+
+    # ----- eBay Logo
+    EBAY_LOGO = SmartLocator(name="eBay Logo")
+    # XPath by ID
+    EBAY_LOGO.add_xpath("//a[@id='gh-la']", "ID")
+    # XPath by class
+    EBAY_LOGO.add_xpath("//a[contains(@class, 'gh-logo')]", "class")
+    # CSS by ID
+    EBAY_LOGO.add_css("a#gh-la", "CSS ID")
+    # XPath by aria-label
+    EBAY_LOGO.add_xpath("//a[@aria-label='eBay Home']", "aria-label")
+    # XPath by href
+    EBAY_LOGO.add_xpath("//a[contains(@href, 'ebay.com')][@class]", "href")
+
+    # Cart Icon
+    CART_ICON = SmartLocator(name="Cart Icon")
+    # CSS by href
+    CART_ICON.add_css("a[href*='cart']", "CSS href")
+    # CSS by aria-label
+    CART_ICON.add_css("a[aria-label*='cart']", "CSS aria-label")
+    # CSS by title
+    CART_ICON.add_css("a[title*='cart']", "CSS title")
+    # CSS by class
+    CART_ICON.add_css("a.cart", "CSS class")
+    # XPath by any cart link text
+    CART_ICON.add_xpath("//a[contains(., 'cart')]", "any cart")
+
+    # -------Category Dropdown
+    CATEGORY_DROPDOWN = SmartLocator(name="Category Dropdown")
+    # XPath by ID
+    CATEGORY_DROPDOWN.add_xpath("//select[@id='gh-cat']", "XPath - ID based")
+    # CSS by ID
+    CATEGORY_DROPDOWN.add_css("#gh-cat", "CSS - ID selector")
+    # CSS by class
+    CATEGORY_DROPDOWN.add_css("select.gh-cat__sel", "CSS - class selector")
+
+    # ------- My eBay Link
+    MY_EBAY_LINK = SmartLocator(name="My eBay Link")
+    # XPath by ID
+    MY_EBAY_LINK.add_xpath("//a[@id='gh-eb-My']", "XPath - ID based")
+
+    # ---- Sign In Link
+
+    # XPath by href
+    SIGN_IN_LINK = SmartLocator(name="Sign In Link")
+    SIGN_IN_LINK.add_xpath(
+        "//a[contains(@href, 'signin')]", "XPath - href contains"
+    )
+    # XPath by class and text
+    SIGN_IN_LINK.add_xpath(
+        "//span[contains(@class, 'gh-eb-u')]/a", "XPath - parent class"
+    )
+
+    locators = {
+        "SEARCH_INPUT": SEARCH_INPUT,
+        "SEARCH_BUTTON": SEARCH_BUTTON,
+        "EBAY_LOGO": EBAY_LOGO,
+        "CART_ICON": CART_ICON,
+        "CATEGORY_DROPDOWN": CATEGORY_DROPDOWN,
+        "MY_EBAY_LINK": MY_EBAY_LINK,
+        "SIGN_IN_LINK": SIGN_IN_LINK,
+    }
+
+    # Merge homogeneous strategies so absent elements fail in one query
+    for smart_locator in locators.values():
+        smart_locator.compile_union()
+
+    return locators
+
+
+_LOCATORS = _build_locators()
+
+
 class HomePage(BasePage):
     """Page object for the Home Page."""
 
     PAGE_URL = "https://www.ebay.com"
     PAGE_NAME = "HomePage"
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._define_locators()
-
-    def _define_locators(self):
-        """Define locators for the Home Page."""
-
-        # ---- Search Input Field
-        self.SEARCH_INPUT = SmartLocator(name="Search Input")
-        # XPath by ID
-
-        self.SEARCH_INPUT.add_xpath("//input[@id='gh-ac']", "XPath - ID based")
-
-        # XPath by placeholder
-        self.SEARCH_INPUT.add_xpath(
-            "//input[@placeholder='Search for anything']", "XPath - placeholder"
-        )
-
-        # CSS by attribute
-        self.SEARCH_INPUT.add_css(
-            "input[type='text'][name='_nkw']", "CSS - attribute selector"
-        )
-
-        # --- Search Button
-        self.SEARCH_BUTTON = SmartLocator(name="Search Button")
-        # XPath by text
-        self.SEARCH_BUTTON.add_xpath("//button[text()='Search']", "text")
-        # XPath by aria-label
-        self.SEARCH_BUTTON.add_xpath("//button[contains(@aria-label, 'Search')]", "aria-label")
-        # CSS by type
-        self.SEARCH_BUTTON.add_css("button[type='submit']", "type")
-        # XPath by class
-        self.SEARCH_BUTTON.add_xpath("//button[contains(@class, 'btn')]", "class")
-        # XPath fallback
-        self.SEARCH_BUTTON.add_xpath("//form[@role='search']//button", "form button")
-
-        # ----- eBay Logo
-        self.EBAY_LOGO = SmartLocator(name="eBay Logo")
-        # XPath by ID
-        self.EBAY_LOGO.add_xpath("//a[@id='gh-la']", "ID")
-        # XPath by class
-        self.EBAY_LOGO.add_xpath("//a[contains(@class, 'gh-logo')]", "class")
-        # CSS by ID
-        self.EBAY_LOGO.add_css("a#gh-la", "CSS ID")
-        # XPath by aria-label
-        self.EBAY_LOGO.add_xpath("//a[@aria-label='eBay Home']", "aria-label")
-        # XPath by href
-        self.EBAY_LOGO.add_xpath("//a[contains(@href, 'ebay.com')][@class]", "href")
-
-        # Cart Icon
-        self.CART_ICON = SmartLocator(name="Cart Icon")
-        # XPath by href
-        self.CART_ICON.add_xpath("//a[contains(@href, 'cart')]", "href")
-        # XPath by aria-label
-        self.CART_ICON.add_xpath("//a[contains(@aria-label, 'cart')]", "aria-label")
-        # CSS by href
-        self.CART_ICON.add_css("a[href*='cart']", "CSS href")
-        # XPath by title
-        self.CART_ICON.add_xpath("//a[contains(@title, 'cart')]", "title")
-        # XPath by any cart link
-        self.CART_ICON.add_xpath("//a[contains(., 'cart') or contains(@class, 'cart')]", "any cart")
-
-        # -------Category Dropdown
-        self.CATEGORY_DROPDOWN = SmartLocator(name="Category Dropdown")
-        # XPath by ID
-        self.CATEGORY_DROPDOWN.add_xpath("//select[@id='gh-cat']", "XPath - ID based")
-        # CSS by ID
-        self.CATEGORY_DROPDOWN.add_css("#gh-cat", "CSS - ID selector")
-        # CSS by class
-        self.CATEGORY_DROPDOWN.add_css("select.gh-cat__sel", "CSS - class selector")
-
-        # ------- My eBay Link
-        self.MY_EBAY_LINK = SmartLocator(name="My eBay Link")
-        # XPath by ID
-        self.MY_EBAY_LINK.add_xpath("//a[@id='gh-eb-My']", "XPath - ID based")
-
-        # ---- Sign In Link
-
-        # XPath by href
-        self.SIGN_IN_LINK = SmartLocator(name="Sign In Link")
-        self.SIGN_IN_LINK.add_xpath(
-            "//a[contains(@href, 'signin')]", "XPath - href contains"
-        )
-        # XPath by class and text
-        self.SIGN_IN_LINK.add_xpath(
-            "//span[contains(@class, 'gh-eb-u')]/a", "XPath - parent class"
-        )
+    SEARCH_INPUT = _LOCATORS["SEARCH_INPUT"]
+    SEARCH_BUTTON = _LOCATORS["SEARCH_BUTTON"]
+    EBAY_LOGO = _LOCATORS["EBAY_LOGO"]
+    CART_ICON = _LOCATORS["CART_ICON"]
+    CATEGORY_DROPDOWN = _LOCATORS["CATEGORY_DROPDOWN"]
+    MY_EBAY_LINK = _LOCATORS["MY_EBAY_LINK"]
+    SIGN_IN_LINK = _LOCATORS["SIGN_IN_LINK"]
 
     @allure_step("Identification - Verify eBay homepage is loaded")
     def identification(self) -> bool:
@@ -115,12 +138,17 @@ class HomePage(BasePage):
             # Wait for page load
             self.wait_for_page_load()
 
-            # Verify key elements are present
+            # Wait for the search input, then check the remaining header
+            # elements together in one round-trip instead of one wait each
+            search_input_visible = self.is_element_visible(self.SEARCH_INPUT)
+            snapshot = self.get_visibility_snapshot(
+                [self.EBAY_LOGO, self.SEARCH_BUTTON, self.CART_ICON]
+            )
             checks = {
-                "eBay Logo": self.is_element_visible(self.EBAY_LOGO),
-                "Search Input": self.is_element_visible(self.SEARCH_INPUT),
-                "Search Button": self.is_element_visible(self.SEARCH_BUTTON),
-                "Cart Icon": self.is_element_visible(self.CART_ICON),
+                "eBay Logo": snapshot[self.EBAY_LOGO.name],
+                "Search Input": search_input_visible,
+                "Search Button": snapshot[self.SEARCH_BUTTON.name],
+                "Cart Icon": snapshot[self.CART_ICON.name],
             }
 
             # Log results
@@ -129,9 +157,10 @@ class HomePage(BasePage):
                 self.logger.info(f"Identification check - {element_name}: {status}")
 
             # Verify URL
-            is_ebay = "ebay.com" in self.current_url.lower()
+            current_url = self.current_url
+            is_ebay = "ebay.com" in current_url.lower()
             self.logger.info(
-                f"URL verification: {self.current_url} - {'VALID' if is_ebay else 'INVALID'}"
+                f"URL verification: {current_url} - {'VALID' if is_ebay else 'INVALID'}"
             )
 
             # Critical elements: Search Input and Search Button must be present
@@ -149,13 +178,13 @@ class HomePage(BasePage):
                 self.capture_screenshot("identification_success")
             else:
                 self.logger.error("Identification: FAILED - Some elements not found")
-                self.capture_screenshot("identification_failure")
+                self.capture_screenshot("identification_failure", failure=True)
 
             return all_passed
 
         except Exception as e:
             self.logger.error(f"Identification failed with error: {str(e)}")
-            self.capture_screenshot("identification_error")
+            self.capture_screenshot("identification_error", failure=True)
             return False
 
     @allure_step("Perform search")
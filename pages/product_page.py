@@ -1,177 +1,321 @@
+import logging
 import random
-from typing import List, Tuple
+import re
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
 
-from playwright.sync_api import Page
+from playwright.sync_api import Page, Response
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
+from config.settings import settings
 from core.base_page import BasePage
-from core.smart_locator import SmartLocator
+from core.smart_locator import ElementNotFoundError, SmartLocator
 from utils.allure_helper import allure_step, AllureHelper
 
+# Every "added to cart" wording eBay uses, as one Playwright text regex
+CART_CONFIRMATION_SELECTOR = "text=/Added to (your )?cart|Item added/i"
+
+# Add to Cart / buy box call-to-action, the last thing add_to_cart needs rendered
+BUY_BOX_READY_SELECTOR = "a.ux-call-to-action, [data-testid='ux-call-to-action-atc']"
+# eBay marks the button aria-disabled until every required variant is chosen
+ADD_TO_CART_ENABLED_SELECTOR = (
+    "[data-testid='ux-call-to-action-atc']:not([aria-disabled='true']), "
+    "a.ux-call-to-action:not([aria-disabled='true'])"
+)
+
+# add_items_to_cart stops trying after this many failed items in a row
+MAX_CONSECUTIVE_ADD_FAILURES = 3
+
+# Listing ID in /itm/<id> and /itm/<slug>/<id> product URLs
+_ITEM_ID_RE = re.compile(r"/itm/(?:[^/?#]+/)?(\d+)")
+
+# Add to Cart endpoint the buy box posts to (cart.payments.ebay.com/sc/add)
+_CART_ADD_URL_RE = re.compile(
+    r"^https?://cart\.payments\.ebay\.[a-z.]+/sc/add(?:[/?#]|$)", re.IGNORECASE
+)
+
+# Any variant picker (msku dropdowns/swatches/boxes, size or color selects),
+# present only on multi-variant listings
+VARIANT_CONTAINER_SELECTOR = (
+    "div.x-msku__select-box, ul.x-msku__swatch-list, div.x-msku__box-cont, "
+    "select[aria-label='Size'], select[id*='Color' i]"
+)
+
+# true: a variant picker is already in the DOM; false: structured data
+# (ld+json) describes a single-offer Product and no picker is present;
+# null: undecided, fall back to waiting for a picker
+_DETECT_VARIANTS_JS = """selector => {
+    if (document.querySelector(selector)) return true;
+    for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+        let data;
+        try { data = JSON.parse(script.textContent); } catch (e) { continue; }
+        for (const item of [].concat(data)) {
+            if (!item) continue;
+            if (item['@type'] === 'ProductGroup' || item.hasVariant) return null;
+            if (item['@type'] === 'Product') {
+                return Array.isArray(item.offers) && item.offers.length > 1 ? null : false;
+            }
+        }
+    }
+    return null;
+}"""
+
+# Non-empty option values of a <select>, read in one round-trip
+_OPTION_VALUES_JS = "sel => [...sel.options].map(o => o.value).filter(v => v)"
+
+# Indices of the matched elements that are not disabled
+_ENABLED_INDICES_JS = """els => els
+    .map((e, i) => (e.disabled || e.getAttribute('aria-disabled') === 'true') ? -1 : i)
+    .filter(i => i >= 0)"""
+
+
+class _NoVariantSelected(Exception):
+    """Raised to leave a response wait early when no variant was picked."""
+
+
+class _AddToCartNotClicked(Exception):
+    """Raised to leave the cart response wait early when the click failed."""
+
+
+def _item_key(url: str) -> str:
+    """Listing ID of a product URL (its tracking parameters vary per result), else the URL."""
+    match = _ITEM_ID_RE.search(url)
+    return match.group(1) if match else url
+
+
+def _is_cart_add_response(response: Response) -> bool:
+    """Match the request the Add to Cart button sends to the cart service."""
+    return (
+        response.request.method == "POST"
+        and _CART_ADD_URL_RE.match(response.url) is not None
+    )
 
-class ProductPage(BasePage):
+
+def _is_variant_response(response: Response) -> bool:
+    """Match the request eBay fires to refresh price/availability for a variant."""
+    if response.request.resource_type not in ("xhr", "fetch"):
+        return False
+    url = response.url.lower()
+    return "msku" in url or "variation" in url
+
+
+def _build_locators() -> Dict[str, SmartLocator]:
     """
-    eBay Product Page object.
-    Handles product details, variant selection, and add to cart functionality.
+    Build the product page locator table.
+
+    Locators only hold selector strings, so one table is shared by every
+    ProductPage instance instead of being rebuilt per page.
     """
+    # Add to Cart Button
+    ADD_TO_CART_BUTTON = SmartLocator(name="Add to Cart Button")
 
-    PAGE_NAME = "ProductPage"
+    # XPath by class and text
+    ADD_TO_CART_BUTTON.add_xpath(
+        "//a[contains(@class, 'ux-call-to-action') and contains(., 'Add to cart')]",
+        "XPath - class and text",
+    )
+    # XPath by span text and ancestor
+    ADD_TO_CART_BUTTON.add_xpath(
+        "//span[contains(text(), 'Add to cart')]/ancestor::a",
+        "XPath - text with ancestor",
+    )
+    # CSS by data-testid
+    ADD_TO_CART_BUTTON.add_css(
+        "[data-testid='ux-call-to-action-atc']", "CSS - data-testid"
+    )
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._define_locators()
+    # Buy It Now Button
+    BUY_NOW_BUTTON = SmartLocator(name="Buy It Now Button")
 
-    def _define_locators(self) -> None:
-        # Add to Cart Button
-        self.ADD_TO_CART_BUTTON = SmartLocator(name="Add to Cart Button")
+    # CSS by ID
+    BUY_NOW_BUTTON.add_css("a#binBtn_btn_1", "CSS - ID binBtn_btn_1")
 
-        # XPath by class and text
-        self.ADD_TO_CART_BUTTON.add_xpath(
-            "//a[contains(@class, 'ux-call-to-action') and contains(., 'Add to cart')]",
-            "XPath - class and text",
-        )
-        # XPath by span text and ancestor
-        self.ADD_TO_CART_BUTTON.add_xpath(
-            "//span[contains(text(), 'Add to cart')]/ancestor::a",
-            "XPath - text with ancestor",
-        )
-        # CSS by data-testid
-        self.ADD_TO_CART_BUTTON.add_css(
-            "[data-testid='ux-call-to-action-atc']", "CSS - data-testid"
-        )
+    # Size Selector (Dropdown)
+    SIZE_SELECTOR = SmartLocator(name="Size Selector")
 
-        # Buy It Now Button
-        self.BUY_NOW_BUTTON = SmartLocator(name="Buy It Now Button")
+    # CSS by msku class and select
+    SIZE_SELECTOR.add_css(
+        "div[class*='x-msku__select-box'] select", "CSS - msku select"
+    )
+    # CSS by aria-label
+    SIZE_SELECTOR.add_css("select[aria-label='Size']", "CSS - aria-label")
+
+    # Size Options
+    SIZE_OPTIONS = SmartLocator(name="Size Options")
+    # CSS by button in swatch
+    SIZE_OPTIONS.add_css(
+        "ul[class*='x-msku__swatch-list'] button", "CSS - swatch list button"
+    )
+    # XPath by label with size text
+    SIZE_OPTIONS.add_xpath(
+        "//div[contains(@class, 'x-msku__box-cont') and .//span[contains(text(),'Size')]]//input",
+        "XPath - msku with size text",
+    )
+    # CSS by class
+    SIZE_OPTIONS.add_css(
+        "div.x-msku__box-cont input[type='radio']", "CSS - container and radio"
+    )
+    # Color Selector
+    COLOR_SELECTOR = SmartLocator(name="Color Selector")
+    # CSS by ID pattern
+    COLOR_SELECTOR.add_css(
+        "select[id*='Color'], select[id*='color']", "CSS - ID contains"
+    )
 
-        # XPath by ID
-        self.BUY_NOW_BUTTON.add_xpath(
-            "//a[@id='binBtn_btn_1']", "XPath - ID binBtn_btn_1"
-        )
+    # Color Options (swatches)
+    COLOR_OPTIONS = SmartLocator(name="Color Options")
+    # CSS by button in swatch
+    COLOR_OPTIONS.add_css(
+        "ul[class*='x-msku__swatch-list'] button", "CSS - swatch list button"
+    )
 
-        # Size Selector (Dropdown)
-        self.SIZE_SELECTOR = SmartLocator(name="Size Selector")
+    # Quantity Input
+    QUANTITY_INPUT = SmartLocator(name="Quantity Input")
+    # CSS by ID
+    QUANTITY_INPUT.add_css("input#qtyTextBox", "CSS - ID qtyTextBox")
+    # CSS by class
+    QUANTITY_INPUT.add_css(
+        "input[class*='x-quantity__input']", "CSS - x-quantity class"
+    )
+    # Product Title
+    PRODUCT_TITLE = SmartLocator(name="Product Title")
+    PRODUCT_TITLE.add_css(
+        "h1[class*='x-item-title']", "CSS - x-item-title class"
+    )
+    # CSS by itemprop
+    PRODUCT_TITLE.add_css("h1[itemprop='name']", "CSS - itemprop name")
+    # CSS by span within title div
+    PRODUCT_TITLE.add_css(
+        "div[class*='x-item-title'] span[class='ux-textspans']",
+        "CSS - span in title div",
+    )
+    # CSS by data-testid
+    PRODUCT_TITLE.add_css("[data-testid='x-item-title']", "CSS - data-testid")
+
+    # Product Price
+    PRODUCT_PRICE = SmartLocator(name="Product Price")
+    PRODUCT_PRICE.add_css(
+        "div[class*='x-price-primary'] span[itemprop='price']",
+        "CSS - itemprop price",
+    )
+    # CSS by class within price div
+    PRODUCT_PRICE.add_css(
+        "div[class*='x-price-primary'] span[class*='ux-textspans']",
+        "CSS - ux-textspans in price",
+    )
+    # CSS by data-testid
+    PRODUCT_PRICE.add_css(
+        "[data-testid='x-price-primary'] span", "CSS - data-testid"
+    )
 
-        # XPath by msku class and select
-        # XPath by msku class and select
-        self.SIZE_SELECTOR.add_xpath(
-            "//div[contains(@class, 'x-msku__select-box')]//select",
-            "XPath - msku select",
-        )
-        # XPath by aria-label
-        self.SIZE_SELECTOR.add_xpath(
-            "//select[@aria-label='Size']", "XPath - aria-label"
-        )
+    # Cart Confirmation
+    CART_CONFIRMATION = SmartLocator(name="Cart Confirmation")
+    CART_CONFIRMATION.add_xpath(
+        "//div[contains(@class, 'ux-overlay')]//span[contains(text(), 'Added to cart')]",
+        "XPath - overlay with text",
+    )
+    # XPath by text content alone
+    CART_CONFIRMATION.add_xpath(
+        "//*[contains(text(), 'Added to cart') or contains(text(), 'added to cart')]",
+        "XPath - text content",
+    )
+    # CSS by atc-confirmation class
+    CART_CONFIRMATION.add_css(
+        "div[class*='atc-confirmation']", "CSS - atc-confirmation class"
+    )
 
-        # Size Options
-        self.SIZE_OPTIONS = SmartLocator(name="Size Options")
-        # XPath by button in swatch
-        self.SIZE_OPTIONS.add_xpath(
-            "//ul[contains(@class, 'x-msku__swatch-list')]//button",
-            "XPath - swatch list button",
-        )
-        # XPath by label with size text
-        self.SIZE_OPTIONS.add_xpath(
-            "//div[contains(@class, 'x-msku__box-cont') and .//span[contains(text(),'Size')]]//input",
-            "XPath - msku with size text",
-        )
-        # CSS by class
-        self.SIZE_OPTIONS.add_css(
-            "div.x-msku__box-cont input[type='radio']", "CSS - container and radio"
-        )
-        # Color Selector
-        self.COLOR_SELECTOR = SmartLocator(name="Color Selector")
-        # CSS by ID pattern
-        self.COLOR_SELECTOR.add_css(
-            "select[id*='Color'], select[id*='color']", "CSS - ID contains"
-        )
+    # Variant Error Message
+    VARIANT_ERROR = SmartLocator(name="Variant Error")
+    # XPath by text content
+    VARIANT_ERROR.add_xpath(
+        "//*[contains(text(), 'Please select')]", "XPath - text Please select"
+    )
+    # CSS by error message class
+    VARIANT_ERROR.add_css(
+        "span[class*='ux-textspans--NEGATIVE']", "CSS - negative textspans"
+    )
 
-        # Quantity Input
-        self.QUANTITY_INPUT = SmartLocator(name="Quantity Input")
-        # XPath by ID
-        self.QUANTITY_INPUT.add_xpath(
-            "//input[@id='qtyTextBox']", "XPath - ID qtyTextBox"
-        )
-        # XPath by class
-        self.QUANTITY_INPUT.add_xpath(
-            "//input[contains(@class, 'x-quantity__input')]", "XPath - x-quantity class"
-        )
-        # Product Title
-        self.PRODUCT_TITLE = SmartLocator(name="Product Title")
-        self.PRODUCT_TITLE.add_xpath(
-            "//h1[contains(@class, 'x-item-title')]", "XPath - x-item-title class"
-        )
-        # XPath by itemprop
-        self.PRODUCT_TITLE.add_xpath("//h1[@itemprop='name']", "XPath - itemprop name")
-        # XPath by span within title div
-        self.PRODUCT_TITLE.add_xpath(
-            "//div[contains(@class, 'x-item-title')]//span[@class='ux-textspans']",
-            "XPath - span in title div",
-        )
-        # XPath by data-testid
-        self.PRODUCT_TITLE.add_xpath(
-            "//*[@data-testid='x-item-title']", "XPath - data-testid"
-        )
+    # Product Image
+    PRODUCT_IMAGE = SmartLocator(name="Product Image")
+    # CSS by ID
+    PRODUCT_IMAGE.add_css("img#icImg", "CSS - ID icImg")
 
-        # Product Price
-        self.PRODUCT_PRICE = SmartLocator(name="Product Price")
-        self.PRODUCT_PRICE.add_xpath(
-            "//div[contains(@class, 'x-price-primary')]//span[@itemprop='price']",
-            "XPath - itemprop price",
-        )
-        # XPath by class within price div
-        self.PRODUCT_PRICE.add_xpath(
-            "//div[contains(@class, 'x-price-primary')]//span[contains(@class, 'ux-textspans')]",
-            "XPath - ux-textspans in price",
-        )
-        # XPath by data-testid
-        self.PRODUCT_PRICE.add_xpath(
-            "//*[@data-testid='x-price-primary']//span", "XPath - data-testid"
-        )
+    locators = {
+        "ADD_TO_CART_BUTTON": ADD_TO_CART_BUTTON,
+        "BUY_NOW_BUTTON": BUY_NOW_BUTTON,
+        "SIZE_SELECTOR": SIZE_SELECTOR,
+        "SIZE_OPTIONS": SIZE_OPTIONS,
+        "COLOR_SELECTOR": COLOR_SELECTOR,
+        "COLOR_OPTIONS": COLOR_OPTIONS,
+        "QUANTITY_INPUT": QUANTITY_INPUT,
+        "PRODUCT_TITLE": PRODUCT_TITLE,
+        "PRODUCT_PRICE": PRODUCT_PRICE,
+        "CART_CONFIRMATION": CART_CONFIRMATION,
+        "VARIANT_ERROR": VARIANT_ERROR,
+        "PRODUCT_IMAGE": PRODUCT_IMAGE,
+    }
 
-        # Cart Confirmation
-        self.CART_CONFIRMATION = SmartLocator(name="Cart Confirmation")
-        self.CART_CONFIRMATION.add_xpath(
-            "//div[contains(@class, 'ux-overlay')]//span[contains(text(), 'Added to cart')]",
-            "XPath - overlay with text",
-        )
-        # XPath by text content alone
-        self.CART_CONFIRMATION.add_xpath(
-            "//*[contains(text(), 'Added to cart') or contains(text(), 'added to cart')]",
-            "XPath - text content",
-        )
-        # XPath by atc-confirmation class
-        self.CART_CONFIRMATION.add_xpath(
-            "//div[contains(@class, 'atc-confirmation')]",
-            "XPath - atc-confirmation class",
-        )
+    # Merge homogeneous strategies so absent elements fail in one query
+    for smart_locator in locators.values():
+        smart_locator.compile_union()
 
-        # Variant Error Message
-        self.VARIANT_ERROR = SmartLocator(name="Variant Error")
-        # XPath by text content
-        self.VARIANT_ERROR.add_xpath(
-            "//*[contains(text(), 'Please select')]", "XPath - text Please select"
-        )
-        # XPath by error message class
-        self.VARIANT_ERROR.add_xpath(
-            "//span[contains(@class, 'ux-textspans--NEGATIVE')]",
-            "XPath - negative textspans",
-        )
+    return locators
+
+
+_LOCATORS = _build_locators()
+
+
+class ProductPage(BasePage):
+    """
+    eBay Product Page object.
+    Handles product details, variant selection, and add to cart functionality.
+    """
 
-        # Product Image
-        self.PRODUCT_IMAGE = SmartLocator(name="Product Image")
-        # XPath by ID
-        self.PRODUCT_IMAGE.add_xpath("//img[@id='icImg']", "XPath - ID icImg")
+    PAGE_NAME = "ProductPage"
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        # (filename, JPEG bytes) of opt-in success screenshots, attached in one batch
+        self.success_screenshots: List[Tuple[str, bytes]] = []
+
+    ADD_TO_CART_BUTTON = _LOCATORS["ADD_TO_CART_BUTTON"]
+    BUY_NOW_BUTTON = _LOCATORS["BUY_NOW_BUTTON"]
+    SIZE_SELECTOR = _LOCATORS["SIZE_SELECTOR"]
+    SIZE_OPTIONS = _LOCATORS["SIZE_OPTIONS"]
+    COLOR_SELECTOR = _LOCATORS["COLOR_SELECTOR"]
+    COLOR_OPTIONS = _LOCATORS["COLOR_OPTIONS"]
+    QUANTITY_INPUT = _LOCATORS["QUANTITY_INPUT"]
+    PRODUCT_TITLE = _LOCATORS["PRODUCT_TITLE"]
+    PRODUCT_PRICE = _LOCATORS["PRODUCT_PRICE"]
+    CART_CONFIRMATION = _LOCATORS["CART_CONFIRMATION"]
+    VARIANT_ERROR = _LOCATORS["VARIANT_ERROR"]
+    PRODUCT_IMAGE = _LOCATORS["PRODUCT_IMAGE"]
 
     def _has_size_selection(self) -> bool:
-        """Check if product requires size selection."""
-        return self.is_element_present(
-            self.SIZE_SELECTOR, timeout=2000
-        ) or self.is_element_present(self.SIZE_OPTIONS, timeout=2000)
+        """Check if product requires size selection (pickers already probed)."""
+        return self.is_element_in_dom(self.SIZE_SELECTOR) or self.is_element_in_dom(
+            self.SIZE_OPTIONS
+        )
 
     def _has_color_selection(self) -> bool:
-        """Check if product requires color selection."""
-        return self.is_element_present(
-            self.COLOR_SELECTOR, timeout=2000
-        ) or self.is_element_present(self.COLOR_OPTIONS, timeout=2000)
+        """Check if product requires color selection (pickers already probed)."""
+        return self.is_element_in_dom(self.COLOR_SELECTOR) or self.is_element_in_dom(
+            self.COLOR_OPTIONS
+        )
+
+    def _click_random_enabled(self, selector: str) -> bool:
+        """
+        Click a random enabled element among those matching selector.
+
+        Returns:
+            True if an element was clicked, False if none was enabled
+        """
+        options = self.page.locator(selector)
+        enabled = options.evaluate_all(_ENABLED_INDICES_JS)
+        if not enabled:
+            return False
+        options.nth(random.choice(enabled)).click()
+        return True
 
     def _select_random_size(self) -> bool:
         """
@@ -182,45 +326,33 @@ class ProductPage(BasePage):
         """
         try:
             # Try dropdown first
-            if self.is_element_present(self.SIZE_SELECTOR, timeout=1000):
+            if self.is_element_in_dom(self.SIZE_SELECTOR):
                 self.log_action("Variant Selection", "Selecting random size from dropdown")
                 size_dropdown = self.find_element(self.SIZE_SELECTOR)
 
-                # Get all options
-                options = size_dropdown.locator("option").all()
-                valid_options = [opt for opt in options if opt.get_attribute("value")]
+                # Get all option values
+                values = size_dropdown.evaluate(_OPTION_VALUES_JS)
 
-                if len(valid_options) > 1:  # Skip first "Select" option
-                    random_option = random.choice(valid_options[1:])
-                    value = random_option.get_attribute("value")
+                if len(values) > 1:  # Skip first "Select" option
+                    value = random.choice(values[1:])
                     size_dropdown.select_option(value=value)
-                    self.logger.info(f"Selected size: {value}")
+                    self.logger.info("Selected size: %s", value)
                     return True
 
             # Try radio buttons/swatches
-            if self.is_element_present(self.SIZE_OPTIONS, timeout=1000):
+            if self.is_element_in_dom(self.SIZE_OPTIONS):
                 self.log_action("Variant Selection", "Selecting random size from options")
-                options = self.page.locator(
-                    "xpath=//div[contains(@class, 'x-msku__box-cont')]//input[@type='radio']"
-                ).all()
-
-                if not options:
-                    options = self.page.locator(
-                        "xpath=//ul[contains(@class, 'x-msku__swatch-list')]//button"
-                    ).all()
-
-                if options:
-                    available_options = [opt for opt in options if opt.is_enabled()]
-                    if available_options:
-                        random_option = random.choice(available_options)
-                        random_option.click()
-                        self.logger.info("Selected random size option")
-                        return True
+                clicked = self._click_random_enabled(
+                    "div[class*='x-msku__box-cont'] input[type='radio']"
+                ) or self._click_random_enabled("ul[class*='x-msku__swatch-list'] button")
+                if clicked:
+                    self.logger.info("Selected random size option")
+                    return True
 
             return False
 
         except Exception as e:
-            self.logger.warning(f"Failed to select size: {e}")
+            self.logger.warning("Failed to select size: %s", e)
             return False
 
     def _select_random_color(self) -> bool:
@@ -232,57 +364,102 @@ class ProductPage(BasePage):
         """
         try:
             # Try dropdown first
-            if self.is_element_present(self.COLOR_SELECTOR, timeout=1000):
+            if self.is_element_in_dom(self.COLOR_SELECTOR):
                 self.log_action("Variant Selection", "Selecting random color from dropdown")
                 color_dropdown = self.find_element(self.COLOR_SELECTOR)
 
-                options = color_dropdown.locator("option").all()
-                valid_options = [opt for opt in options if opt.get_attribute("value")]
+                values = color_dropdown.evaluate(_OPTION_VALUES_JS)
 
-                if len(valid_options) > 1:
-                    random_option = random.choice(valid_options[1:])
-                    value = random_option.get_attribute("value")
+                if len(values) > 1:
+                    value = random.choice(values[1:])
                     color_dropdown.select_option(value=value)
-                    self.logger.info(f"Selected color: {value}")
+                    self.logger.info("Selected color: %s", value)
                     return True
 
             # Try color swatches
-            if self.is_element_present(self.COLOR_OPTIONS, timeout=1000):
+            if self.is_element_in_dom(self.COLOR_OPTIONS):
                 self.log_action("Variant Selection", "Selecting random color from swatches")
-                swatches = self.page.locator(
-                    "xpath=//ul[contains(@class, 'x-msku__swatch-list')]//button"
-                ).all()
-
-                if swatches:
-                    available_swatches = [s for s in swatches if s.is_enabled()]
-                    if available_swatches:
-                        random_swatch = random.choice(available_swatches)
-                        random_swatch.click()
-                        self.logger.info("Selected random color swatch")
-                        return True
+                if self._click_random_enabled("ul[class*='x-msku__swatch-list'] button"):
+                    self.logger.info("Selected random color swatch")
+                    return True
 
             return False
 
         except Exception as e:
-            self.logger.warning(f"Failed to select color: {e}")
+            self.logger.warning("Failed to select color: %s", e)
             return False
 
+    def _select_and_wait_for_update(self, select: Callable[[], bool]) -> bool:
+        """
+        Run a variant selection and wait for the price/availability update it triggers.
+
+        Args:
+            select: Selection method returning True if a variant was picked
+
+        Returns:
+            True if a variant was picked, False otherwise
+        """
+        try:
+            with self.page.expect_response(_is_variant_response, timeout=3000):
+                if not select():
+                    raise _NoVariantSelected()
+            return True
+        except _NoVariantSelected:
+            return False
+        except PlaywrightTimeout:
+            self.logger.debug("No variant update response seen, continuing")
+            return True
+
+    def _detect_variants(self) -> Optional[bool]:
+        """
+        Decide from the current DOM and ld+json data whether variants exist.
+
+        Returns:
+            True/False when known without waiting, None when undecided
+        """
+        try:
+            result = self.page.evaluate(_DETECT_VARIANTS_JS, VARIANT_CONTAINER_SELECTOR)
+        except Exception as e:
+            self.logger.debug("Variant detection failed: %s", e)
+            return None
+        return result if isinstance(result, bool) else None
+
     def _handle_variant_selection(self) -> None:
         """Handle all variant selections (size, color, etc.) if required."""
         self.log_action("Variant Selection", "Checking for required variants")
 
-        # Small delay to let page fully load variant options
-        self.page.wait_for_timeout(1000)
+        # Structured data answers instantly for most listings
+        has_variants = self._detect_variants()
+        if has_variants is False:
+            self.logger.debug("Single-offer product, skipping variant selection")
+            return
+
+        # One probe for every variant picker; most listings have none
+        if has_variants is None:
+            try:
+                self.page.wait_for_selector(
+                    VARIANT_CONTAINER_SELECTOR, timeout=800, state="attached"
+                )
+            except PlaywrightTimeout:
+                self.logger.debug("No variant options on page")
+                return
+
+        selected = False
 
         # Select size if available
         if self._has_size_selection():
-            self._select_random_size()
-            self.page.wait_for_timeout(500)  # Wait for price/availability update
+            selected |= self._select_and_wait_for_update(self._select_random_size)
 
         # Select color if available
         if self._has_color_selection():
-            self._select_random_color()
-            self.page.wait_for_timeout(500)
+            selected |= self._select_and_wait_for_update(self._select_random_color)
+
+        # Continue as soon as the buy box accepts the selection
+        if selected:
+            try:
+                self.page.wait_for_selector(ADD_TO_CART_ENABLED_SELECTOR, timeout=2000)
+            except PlaywrightTimeout:
+                self.logger.debug("Add to cart button still disabled after variant selection")
 
     def _click_add_to_cart(self) -> bool:
         """
@@ -303,66 +480,93 @@ class ProductPage(BasePage):
             return False
 
         except Exception as e:
-            self.logger.error(f"Failed to click Add to Cart: {e}")
+            self.logger.error("Failed to click Add to Cart: %s", e)
             return False
 
+    def _click_and_wait_for_cart_response(self) -> Tuple[bool, Optional[Response]]:
+        """
+        Click Add to Cart with the cart response wait registered before the click.
+
+        Returns:
+            (clicked, the cart's add response or None if none was seen in time)
+        """
+        try:
+            with self.page.expect_response(_is_cart_add_response, timeout=5000) as response_info:
+                if not self._click_add_to_cart():
+                    raise _AddToCartNotClicked()
+            return True, response_info.value
+        except _AddToCartNotClicked:
+            return False, None
+        except PlaywrightTimeout:
+            self.logger.debug("No cart add response seen, checking the page")
+            return True, None
+
     def _verify_added_to_cart(self) -> bool:
         """
-        Verify item was added to cart.
+        Verify item was added to cart from the page (confirmation or redirect).
 
         Returns:
             True if confirmation found, False otherwise
         """
         try:
-            # Wait for confirmation modal/message
-            self.page.wait_for_timeout(2000)  # Give time for modal to appear
-
-            # Check for various confirmation indicators
-            confirmation_texts = [
-                "Added to cart",
-                "added to cart",
-                "Added to your cart",
-                "Item added",
-            ]
-
-            for text in confirmation_texts:
-                if self.page.locator(f"text={text}").count() > 0:
-                    self.logger.info(f"Cart confirmation found: '{text}'")
-                    return True
-
-            # Check URL change (some flows redirect to cart)
-            if "cart" in self.current_url.lower():
-                self.logger.info("Redirected to cart page - item added")
-                return True
+            # One wait covering every confirmation wording; returns on first match
+            self.page.wait_for_selector(CART_CONFIRMATION_SELECTOR, timeout=3000)
+            self.logger.info("Cart confirmation found")
+            return True
+        except PlaywrightTimeout:
+            pass
+        except Exception as e:
+            self.logger.warning("Error verifying cart addition: %s", e)
+            return False
 
-            self.logger.warning("Could not verify item was added to cart")
-            return True  # Assume success if no error appeared
+        # Check URL change (some flows redirect to cart)
+        if "cart" in self.current_url.lower():
+            self.logger.info("Redirected to cart page - item added")
+            return True
 
-        except Exception as e:
-            self.logger.warning(f"Error verifying cart addition: {e}")
-            return True  # Assume success
+        self.logger.warning("Could not verify item was added to cart")
+        return False
 
     def get_product_title(self) -> str:
         """Get the product title."""
         try:
             return self.get_text(self.PRODUCT_TITLE).strip()
-        except:
+        except (ElementNotFoundError, PlaywrightTimeout):
             return "Unknown Product"
 
     def get_product_price(self) -> str:
         """Get the product price."""
         try:
             return self.get_text(self.PRODUCT_PRICE).strip()
-        except:
+        except (ElementNotFoundError, PlaywrightTimeout):
             return "Unknown Price"
 
+    def preload(self, url: str) -> bool:
+        """
+        Start loading a product page without waiting for it to finish.
+
+        Returns once the navigation is committed, so the page keeps loading
+        in the background until add_to_cart(url, preloaded=True) picks it up.
+
+        Returns:
+            True if the navigation was committed, False otherwise
+        """
+        try:
+            self._reset_document_caches()
+            self.page.goto(url, wait_until="commit")
+            return True
+        except Exception as e:
+            self.logger.warning("Failed to preload %s: %s", url[:80], e)
+            return False
+
     @allure_step("Add single item to cart")
-    def add_to_cart(self, url: str) -> bool:
+    def add_to_cart(self, url: str, preloaded: bool = False) -> bool:
         """
         Add a single item to cart.
 
         Args:
             url: Product URL to add
+            preloaded: The page was already sent to url via preload()
 
         Returns:
             True if successfully added, False otherwise
@@ -371,86 +575,199 @@ class ProductPage(BasePage):
 
         try:
             # Navigate to product page
-            self.navigate(url)
-            self.wait_for_page_load()
-            self.wait_for_network_idle()
-
-            # Get product info for logging
-            title = self.get_product_title()
-            price = self.get_product_price()
-            self.logger.info(f"Product: {title[:50]}... - {price}")
+            # DOM + buy box only; eBay beacons keep the network busy indefinitely
+            if preloaded:
+                self.wait_for_dom_ready()
+            else:
+                self.navigate(url, wait_until="domcontentloaded")
+            try:
+                self.page.wait_for_selector(BUY_BOX_READY_SELECTOR, timeout=5000)
+            except PlaywrightTimeout:
+                self.logger.debug("Buy box not rendered yet, continuing")
 
             # Handle variant selection
             self._handle_variant_selection()
 
+            # Product info only feeds the log and screenshot name. It is read
+            # before the click (the page may redirect to the cart after it),
+            # and with a short wait that never screenshots or raises
+            title = ""
+            if self.logger.isEnabledFor(logging.INFO) or settings.REPORT.screenshot_on_success:
+                title = (self.get_text_if_present(self.PRODUCT_TITLE, timeout=1000) or "").strip()
+                price = (self.get_text_if_present(self.PRODUCT_PRICE, timeout=1000) or "").strip()
+                self.logger.info(
+                    "Product: %s... - %s", title[:50] or "Unknown Product", price or "Unknown Price"
+                )
+
             # Click Add to Cart
-            if not self._click_add_to_cart():
-                self.capture_screenshot("add_to_cart_failed")
+            clicked, cart_response = self._click_and_wait_for_cart_response()
+            if not clicked:
+                self.capture_screenshot("add_to_cart_failed", failure=True)
                 return False
 
-            # Wait and verify
-            self.page.wait_for_timeout(2000)
-            success = self._verify_added_to_cart()
+            # A rejected add request fails fast; otherwise the page still has
+            # to show the confirmation before the item counts as added
+            if cart_response is not None and not cart_response.ok:
+                self.logger.warning("Cart add request failed: HTTP %s", cart_response.status)
+                success = False
+            else:
+                success = self._verify_added_to_cart()
 
             if success:
-                self.logger.info(f"Successfully added to cart: {title[:50]}...")
-                self.capture_screenshot(f"added_to_cart_{title[:20].replace(' ', '_')}")
+                self.logger.info("Successfully added to cart: %s...", title[:50])
+                if settings.REPORT.screenshot_on_success:
+                    self.success_screenshots.append((
+                        f"added_to_cart_{title[:20].replace(' ', '_')}.jpg",
+                        self.page.screenshot(type="jpeg", quality=60),
+                    ))
 
             return success
 
         except Exception as e:
-            self.logger.error(f"Failed to add item to cart: {e}")
-            self.capture_screenshot("add_to_cart_error")
+            self.logger.error("Failed to add item to cart: %s", e)
+            self.capture_screenshot("add_to_cart_error", failure=True)
             return False
 
 
 @allure_step("Add items to cart")
-def add_items_to_cart(page: Page, urls: List[str]) -> Tuple[List[str], List[str]]:
+def add_items_to_cart(
+    page: Page,
+    urls: List[str],
+    max_concurrency: Optional[int] = None,
+    product_page_factory: Optional[Callable[[Page], ProductPage]] = None,
+) -> Tuple[List[str], List[str]]:
     """
     Function name: addItemsToCart
 
     Iterate over each provided URL and add items to cart.
     Handles variant selection randomly and captures screenshots.
 
+    Product pages are loaded ahead on up to max_concurrency pages opened in
+    the same browser context (so they share the cart cookie): while one page
+    is being worked, the next URLs are already loading on the others. The
+    add-to-cart interactions themselves still run one at a time, in order.
+    Repeated listings (same item ID, whatever the query string) are processed
+    once and reported under their first URL only, so the successful list
+    matches what is in the cart. After MAX_CONSECUTIVE_ADD_FAILURES failures
+    in a row (blocked or degraded site) the remaining URLs are reported failed
+    without trying.
+
     Args:
         page: Playwright Page object
         urls: List of product URLs to add to cart
+        max_concurrency: Pages loading in parallel
+            (default: settings.PARALLEL.add_to_cart_concurrency)
+        product_page_factory: Builds the page object for each pooled page
+            (default: ProductPage)
 
     Returns:
-        Tuple of (successful_urls, failed_urls)
+        Tuple of (successful_urls, failed_urls), repeated listings left out
     """
-    import logging
-
     logger = logging.getLogger("addItemsToCart")
 
-    logger.info(f"addItemsToCart: Processing {len(urls)} items")
-
-    successful_urls: List[str] = []
-    failed_urls: List[str] = []
-
-    product_page = ProductPage(page)
-
-    for index, url in enumerate(urls, 1):
-        logger.info(f"Processing item {index}/{len(urls)}")
-
-        try:
-            success = product_page.add_to_cart(url)
-
-            if success:
-                successful_urls.append(url)
-                logger.info(f"Item {index} added successfully")
-            else:
-                failed_urls.append(url)
-                logger.warning(f"Item {index} failed to add")
+    logger.info("addItemsToCart: Processing %s items", len(urls))
+
+    first_url: Dict[str, str] = {}  # preserves order
+    for url in urls:
+        first_url.setdefault(_item_key(url), url)
+    unique_urls = list(first_url.values())
+    skipped_duplicates = len(urls) - len(unique_urls)
+    if skipped_duplicates:
+        logger.info("Skipping %s repeated listings", skipped_duplicates)
+    added: Dict[str, bool] = {}
+
+    if max_concurrency is None:
+        max_concurrency = settings.PARALLEL.add_to_cart_concurrency
+    pool_size = max(1, min(max_concurrency, len(unique_urls)))
+
+    # Sync Playwright objects are bound to the thread that created them, and a
+    # separate context would fill a different guest cart, so items are worked
+    # on this thread and the overlap comes from preloading on extra pages.
+    # Extra pages share the caller's context; only they are closed afterwards
+    extra_pages: List[Page] = []
+    try:
+        for _ in range(pool_size - 1):
+            extra_pages.append(page.context.new_page())
+    except Exception as e:
+        logger.warning("Could not open extra pages, continuing with fewer: %s", e)
+
+    make_product_page = product_page_factory or ProductPage
+    pool = [make_product_page(p) for p in [page, *extra_pages]]
+    pending = deque(enumerate(unique_urls, 1))
+    in_flight = deque()
+    consecutive_failures = 0
+
+    def dispatch(product_page: ProductPage) -> None:
+        if not pending:
+            return
+        index, url = pending.popleft()
+        preloaded = len(pool) > 1 and product_page.preload(url)
+        in_flight.append((product_page, index, url, preloaded))
+
+    try:
+        for product_page in pool:
+            dispatch(product_page)
+
+        while in_flight:
+            product_page, index, url, preloaded = in_flight.popleft()
+            logger.info("Processing item %s/%s", index, len(unique_urls))
+
+            try:
+                if preloaded:
+                    success = product_page.add_to_cart(url, preloaded=True)
+                else:
+                    success = product_page.add_to_cart(url)
+
+                added[url] = bool(success)
+                if success:
+                    logger.info("Item %s added successfully", index)
+                else:
+                    logger.warning("Item %s failed to add", index)
+
+            except Exception as e:
+                logger.error("Error processing item %s: %s", index, e)
+                added[url] = False
+
+            consecutive_failures = 0 if added[url] else consecutive_failures + 1
+            if consecutive_failures >= MAX_CONSECUTIVE_ADD_FAILURES:
+                skipped = [u for _, _, u, _ in in_flight] + [u for _, u in pending]
+                logger.error(
+                    "%s failures in a row, skipping %s remaining items",
+                    consecutive_failures,
+                    len(skipped),
+                )
+                added.update(dict.fromkeys(skipped, False))
+                break
+
+            # Hand the freed page the next URL so it loads while others work
+            dispatch(product_page)
+    finally:
+        for extra_page in extra_pages:
+            try:
+                extra_page.close()
+            except Exception:
+                pass
+
+    # One zip attachment instead of a file per item
+    if settings.REPORT.screenshot_on_success:
+        screenshots = [
+            shot for product_page in pool for shot in product_page.success_screenshots
+        ]
+        AllureHelper.attach_zip(
+            [(f"{i:02d}_{filename}", data) for i, (filename, data) in enumerate(screenshots, 1)],
+            "Added to Cart Screenshots",
+        )
 
-        except Exception as e:
-            logger.error(f"Error processing item {index}: {e}")
-            failed_urls.append(url)
+    # Each listing counts once, so successes match the items in the cart
+    successful_urls = [url for url in unique_urls if added[url]]
+    failed_urls = [url for url in unique_urls if not added[url]]
 
     # Summary
     logger.info(
-        f"addItemsToCart completed: "
-        f"{len(successful_urls)} successful, {len(failed_urls)} failed"
+        "addItemsToCart completed: %s successful, %s failed, %s duplicates skipped",
+        len(successful_urls),
+        len(failed_urls),
+        skipped_duplicates,
     )
 
     # Attach results to Allure
@@ -459,6 +776,7 @@ def add_items_to_cart(page: Page, urls: List[str]) -> Tuple[List[str], List[str]
             "total_items": len(urls),
             "successful": len(successful_urls),
             "failed": len(failed_urls),
+            "skipped_duplicates": skipped_duplicates,
             "successful_urls": successful_urls,
             "failed_urls": failed_urls,
         },
@@ -1,11 +1,143 @@
 import re
-from typing import List, Optional
-from playwright.sync_api import Page, Locator
-
+from collections import deque
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from weakref import WeakSet
+from playwright.sync_api import BrowserContext
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from config.settings import settings
 from core.base_page import BasePage
-from core.smart_locator import SmartLocator
+from core.smart_locator import ElementNotFoundError, SmartLocator
 from utils.allure_helper import allure_step, AllureHelper
 
+_PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+_COUNT_RE = re.compile(r'[\d,]+')
+_PRICE_FAST = str.maketrans('', '', '$,')
+
+RESULT_ITEM_SELECTOR = "li.s-item"
+
+# Contexts whose home page has been opened and identified; later searches
+# started from an eBay page in them use the header search directly
+_initialized_contexts: "WeakSet[BrowserContext]" = WeakSet()
+
+# href of the enabled Next link ("" if it has none), null when there is no
+# next page; eBay keeps a disabled Next link on the last page
+_NEXT_PAGE_JS = """() => {
+    const a = document.querySelector("a.pagination__next:not([aria-disabled='true'])");
+    return a ? a.getAttribute('href') || '' : null;
+}"""
+
+# href and raw price text of result items with a link and a rendered price,
+# in DOM order (hidden placeholder items have no client rects). Items whose
+# first price (the rule _parse_price uses) is over maxPrice never leave the
+# page; stops after cap rows, or reads the whole page when cap is null
+_EXTRACT_ITEMS_JS = """({cap, maxPrice}) => {
+    const max = cap == null ? Infinity : cap;
+    const rows = [];
+    for (const li of document.querySelectorAll('li.s-item')) {
+        if (rows.length >= max) break;
+        const a = li.querySelector('a.s-item__link, a[href*="/itm/"]');
+        const p = li.querySelector('span.s-item__price');
+        if (!a || !a.href || !p || p.getClientRects().length === 0) continue;
+        const text = p.textContent;
+        const m = text.split(/ to /i)[0].match(/[\\d,]+\\.?\\d*/);
+        if (m && parseFloat(m[0].replace(/,/g, '')) > maxPrice) continue;
+        rows.push({href: a.href, priceText: text});
+    }
+    return rows;
+}"""
+
+# Rows read per needed item on the first pass, leaving room for items that
+# are over the price limit or already collected
+_EXTRACT_SLACK = 3
+
+
+def _build_locators() -> Dict[str, SmartLocator]:
+    """Build the search results locator table, shared by every SearchResultsPage."""
+    PRICE_MIN_INPUT = SmartLocator(name="Price Min Input")
+    PRICE_MIN_INPUT.add_css("input.x-price-range__input--min", "class")
+    PRICE_MIN_INPUT.add_css("input[aria-label='Minimum value in $']", "aria-label")
+    PRICE_MIN_INPUT.add_css("input[placeholder='Min']", "placeholder")
+
+    PRICE_MAX_INPUT = SmartLocator(name="Price Max Input")
+    PRICE_MAX_INPUT.add_css("input.x-price-range__input--max", "class")
+    PRICE_MAX_INPUT.add_css("input[aria-label='Maximum value in $']", "aria-label")
+    PRICE_MAX_INPUT.add_css("input[name='_udhi']", "name")
+
+    PRICE_FILTER_SUBMIT = SmartLocator(name="Price Filter Submit")
+    PRICE_FILTER_SUBMIT.add_css("button[aria-label='Submit price range']", "aria-label")
+
+    RESULTS_CONTAINER = SmartLocator(name="Results Container")
+    RESULTS_CONTAINER.add_css("ul#srp-river-results", "id")
+    RESULTS_CONTAINER.add_css("ul[data-view='list']", "data-view")
+
+    RESULT_ITEMS = SmartLocator(name="Result Items")
+    RESULT_ITEMS.add_css("ul.srp-results > li.s-item", "class")
+    RESULT_ITEMS.add_css("li[data-view='mi:1686|iid:1']", "data-view")
+    RESULT_ITEMS.add_xpath("//ul[contains(@class, 'srp-results')]/li[contains(@class, 's-item')]", "class")
+
+    ITEM_LINK = SmartLocator(name="Item Link")
+    ITEM_LINK.add_css("a[href*='/itm/']", "href")
+    ITEM_LINK.add_xpath(".//a[@data-track='true']", "data-track")
+
+    ITEM_PRICE = SmartLocator(name="Item Price")
+    ITEM_PRICE.add_css("span.s-item__price", "class")
+    ITEM_PRICE.add_xpath(".//span[starts-with(normalize-space(text()), '$')]", "text")
+
+    ITEM_TITLE = SmartLocator(name="Item Title")
+    ITEM_TITLE.add_css("div.s-item__title span", "class")
+    ITEM_TITLE.add_xpath(".//div[contains(@class, 's-item__title')]//span[@role='heading']", "class")
+
+    NEXT_PAGE_BUTTON = SmartLocator(name="Next Page Button")
+    NEXT_PAGE_BUTTON.add_css("a.pagination__next", "class")
+    NEXT_PAGE_BUTTON.add_xpath("//a[contains(@class, 'pagination__next')]", "class")
+
+    PREV_PAGE_BUTTON = SmartLocator(name="Previous Page Button")
+    PREV_PAGE_BUTTON.add_css("a.pagination__prev", "class")
+    PREV_PAGE_BUTTON.add_css("a[type='prev']", "type")
+
+    RESULTS_COUNT = SmartLocator(name="Results Count")
+    RESULTS_COUNT.add_css(".srp-controls__count-heading", "class")
+    RESULTS_COUNT.add_css("span[class*='srp-controls__count']", "class")
+    RESULTS_COUNT.add_xpath("//h1[contains(text(), 'results')]", "text")
+
+    SORT_DROPDOWN = SmartLocator(name="Sort Dropdown")
+    SORT_DROPDOWN.add_css("button.srp-controls__sort", "class")
+    SORT_DROPDOWN.add_css("button[aria-label='Sort selector. Best Match selected.']", "aria-label")
+
+    NO_RESULTS = SmartLocator(name="No Results Message")
+    NO_RESULTS.add_css("div[class*='srp-no-results']", "class")
+    NO_RESULTS.add_xpath("//*[contains(text(), 'No exact matches found')]", "text")
+    NO_RESULTS.add_xpath("//h3[contains(text(), 'No results')]", "text")
+
+    locators = {
+        "PRICE_MIN_INPUT": PRICE_MIN_INPUT,
+        "PRICE_MAX_INPUT": PRICE_MAX_INPUT,
+        "PRICE_FILTER_SUBMIT": PRICE_FILTER_SUBMIT,
+        "RESULTS_CONTAINER": RESULTS_CONTAINER,
+        "RESULT_ITEMS": RESULT_ITEMS,
+        "ITEM_LINK": ITEM_LINK,
+        "ITEM_PRICE": ITEM_PRICE,
+        "ITEM_TITLE": ITEM_TITLE,
+        "NEXT_PAGE_BUTTON": NEXT_PAGE_BUTTON,
+        "PREV_PAGE_BUTTON": PREV_PAGE_BUTTON,
+        "RESULTS_COUNT": RESULTS_COUNT,
+        "SORT_DROPDOWN": SORT_DROPDOWN,
+        "NO_RESULTS": NO_RESULTS,
+    }
+
+    # Merge homogeneous strategies so absent elements fail in one query
+    for smart_locator in locators.values():
+        smart_locator.compile_union()
+
+    return locators
+
+
+_LOCATORS = _build_locators()
+
 
 class SearchResultsPage(BasePage):
     """
@@ -14,73 +146,35 @@ class SearchResultsPage(BasePage):
     """
     
     PAGE_NAME = "SearchResultsPage"
-    
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self._define_locators()
-    
-    def _define_locators(self) -> None:
-        self.PRICE_MIN_INPUT = SmartLocator(name="Price Min Input")
-        self.PRICE_MIN_INPUT.add_xpath("//input[@aria-label='Minimum value in $']", "aria-label")
-        self.PRICE_MIN_INPUT.add_xpath("//input[contains(@class, 'x-price-range__input--min')]", "class")
-        self.PRICE_MIN_INPUT.add_xpath("//input[@placeholder='Min']", "placeholder")
-
-        self.PRICE_MAX_INPUT = SmartLocator(name="Price Max Input")
-        self.PRICE_MAX_INPUT.add_css("input.x-price-range__input--max", "class")
-        self.PRICE_MAX_INPUT.add_css("input[aria-label='Maximum value in $']", "aria-label")
-        self.PRICE_MAX_INPUT.add_css("input[name='_udhi']", "name")
-
-        self.PRICE_FILTER_SUBMIT = SmartLocator(name="Price Filter Submit")
-        self.PRICE_FILTER_SUBMIT.add_xpath("//button[@aria-label='Submit price range']", "aria-label")
-
-        self.RESULTS_CONTAINER = SmartLocator(name="Results Container")
-        self.RESULTS_CONTAINER.add_xpath("//ul[@id='srp-river-results']", "id")
-        self.RESULTS_CONTAINER.add_xpath("//ul[@data-view='list']", "data-view")
-
-        self.RESULT_ITEMS = SmartLocator(name="Result Items")
-        self.RESULT_ITEMS.add_xpath("//ul[contains(@class, 'srp-results')]/li[contains(@class, 's-item')]", "class")
-        self.RESULT_ITEMS.add_xpath("//li[@data-view='mi:1686|iid:1']", "data-view")
-
-        self.ITEM_LINK = SmartLocator(name="Item Link")
-        self.ITEM_LINK.add_css("a[href*='/itm/']", "href")
-        self.ITEM_LINK.add_xpath(".//a[@data-track='true']", "data-track")
-
-        self.ITEM_PRICE = SmartLocator(name="Item Price")
-        self.ITEM_PRICE.add_xpath(".//span[@class='s-item__price']", "class")
-        self.ITEM_PRICE.add_xpath(".//span[starts-with(normalize-space(text()), '$')]", "text")
-
-        self.ITEM_TITLE = SmartLocator(name="Item Title")
-        self.ITEM_TITLE.add_xpath(".//div[contains(@class, 's-item__title')]//span[@role='heading']", "class")
-        self.ITEM_TITLE.add_css("div.s-item__title span", "class")
-
-        self.NEXT_PAGE_BUTTON = SmartLocator(name="Next Page Button")
-        self.NEXT_PAGE_BUTTON.add_xpath("//a[contains(@class, 'pagination__next')]", "class")
-
-        self.PREV_PAGE_BUTTON = SmartLocator(name="Previous Page Button")
-        self.PREV_PAGE_BUTTON.add_xpath("//a[@type='prev']", "type")
-        self.PREV_PAGE_BUTTON.add_css("a.pagination__prev", "class")
-
-        self.RESULTS_COUNT = SmartLocator(name="Results Count")
-        self.RESULTS_COUNT.add_xpath("//span[contains(@class, 'srp-controls__count')]", "class")
-        self.RESULTS_COUNT.add_xpath("//h1[contains(text(), 'results')]", "text")
-        self.RESULTS_COUNT.add_css(".srp-controls__count-heading", "class")
-
-        self.SORT_DROPDOWN = SmartLocator(name="Sort Dropdown")
-        self.SORT_DROPDOWN.add_xpath("//button[@aria-label='Sort selector. Best Match selected.']", "aria-label")
-        self.SORT_DROPDOWN.add_css("button.srp-controls__sort", "class")
-
-        self.NO_RESULTS = SmartLocator(name="No Results Message")
-        self.NO_RESULTS.add_xpath("//div[contains(@class, 'srp-no-results')]", "class")
-        self.NO_RESULTS.add_xpath("//*[contains(text(), 'No exact matches found')]", "text")
-        self.NO_RESULTS.add_xpath("//h3[contains(text(), 'No results')]", "text")
-        
+
+    PRICE_MIN_INPUT = _LOCATORS["PRICE_MIN_INPUT"]
+    PRICE_MAX_INPUT = _LOCATORS["PRICE_MAX_INPUT"]
+    PRICE_FILTER_SUBMIT = _LOCATORS["PRICE_FILTER_SUBMIT"]
+    RESULTS_CONTAINER = _LOCATORS["RESULTS_CONTAINER"]
+    RESULT_ITEMS = _LOCATORS["RESULT_ITEMS"]
+    ITEM_LINK = _LOCATORS["ITEM_LINK"]
+    ITEM_PRICE = _LOCATORS["ITEM_PRICE"]
+    ITEM_TITLE = _LOCATORS["ITEM_TITLE"]
+    NEXT_PAGE_BUTTON = _LOCATORS["NEXT_PAGE_BUTTON"]
+    PREV_PAGE_BUTTON = _LOCATORS["PREV_PAGE_BUTTON"]
+    RESULTS_COUNT = _LOCATORS["RESULTS_COUNT"]
+    SORT_DROPDOWN = _LOCATORS["SORT_DROPDOWN"]
+    NO_RESULTS = _LOCATORS["NO_RESULTS"]
+
     def _parse_price(self, price_text: str) -> Optional[float]:
         """Parse price from text string."""
         try:
             cleaned = price_text.strip()
-            if " to " in cleaned.lower():
-                cleaned = cleaned.split(" to ")[0].strip()
-            match = re.search(r'[\d,]+\.?\d*', cleaned)
+            # A range ("$20.00 to $40.00") is judged by its low end
+            range_start = cleaned.lower().find(" to ")
+            if range_start != -1:
+                cleaned = cleaned[:range_start].strip()
+            # Plain "$1,234.56" needs no regex
+            if cleaned.startswith('$'):
+                number = cleaned.translate(_PRICE_FAST)
+                if number.replace('.', '', 1).isdecimal() and number.isascii():
+                    return float(number)
+            match = _PRICE_RE.search(cleaned)
             if match:
                 price_str = match.group().replace(',', '')
                 return float(price_str)
@@ -91,7 +185,8 @@ class SearchResultsPage(BasePage):
     
     def _is_price_filter_available(self) -> bool:
         """Check if price filter inputs are available."""
-        return self.is_element_present(self.PRICE_MAX_INPUT, timeout=3000)
+        # The filter renders with the results, so there is nothing to wait for
+        return self.is_element_in_dom(self.PRICE_MAX_INPUT)
     
     def _apply_price_filter(self, max_price: float, min_price: float = 0) -> bool:
         """Apply price filter."""
@@ -101,173 +196,254 @@ class SearchResultsPage(BasePage):
             self.logger.info("Price filter not available on this page")
             return False
 
+        # eBay's price inputs take whole dollars
+        low, high = str(int(min_price)), str(int(max_price))
         try:
             if min_price > 0:
-                self.fill(self.PRICE_MIN_INPUT, str(int(min_price)))
-            self.fill(self.PRICE_MAX_INPUT, str(int(max_price)))
+                self.fill(self.PRICE_MIN_INPUT, low)
+            self.fill(self.PRICE_MAX_INPUT, high)
             self.click(self.PRICE_FILTER_SUBMIT)
             self.wait_for_page_load()
-            self.wait_for_network_idle()
+            self._wait_results_ready()
             self.logger.info(f"Price filter applied: ${min_price} - ${max_price}")
             return True
         except Exception as e:
             self.logger.warning(f"Failed to apply price filter: {e}")
             return False
     
+    def _next_page_href(self) -> Optional[str]:
+        """Return the enabled Next link's href ("" without one), None if there is no next page."""
+        try:
+            return self.page.evaluate(_NEXT_PAGE_JS)
+        except PlaywrightError:
+            return None
+
     def _is_next_page_available(self) -> bool:
-        """Check if next page button is available."""
-        return self.is_element_present(self.NEXT_PAGE_BUTTON, timeout=3000)
-    
+        """Check if an enabled next page link is on the page, without waiting."""
+        return self._next_page_href() is not None
+
     def _go_to_next_page(self) -> bool:
         """Navigate to next results page."""
-        if not self._is_next_page_available():
+        # One probe answers both "is there a next page" and "where does it go"
+        next_href = self._next_page_href()
+        if next_href is None:
             self.logger.info("No next page available")
             return False
         try:
             self.log_action("Pagination", "Navigating to next page")
-            self.click(self.NEXT_PAGE_BUTTON)
-            self.wait_for_page_load()
-            self.wait_for_network_idle()
+            if next_href:
+                # Plain navigation skips the click handler and the full page load
+                self.navigate(urljoin(self.current_url, next_href), wait_until="domcontentloaded")
+                self._wait_results_ready()
+            else:
+                self.click(self.NEXT_PAGE_BUTTON)
+                self.wait_for_page_load()
+                self._wait_results_ready()
             self.logger.info("Successfully navigated to next page")
             return True
         except Exception as e:
             self.logger.warning(f"Failed to navigate to next page: {e}")
             return False
     
-    def _extract_items_from_current_page(self, max_price: float, limit: int, collected_urls: List[str]) -> List[str]:
-        """Extract item URLs from current page."""
+    def _extract_items_js(self, max_price: float, cap: Optional[int] = None) -> List[Dict[str, str]]:
+        """Read the link and price text of up to cap result items priced at or under max_price."""
+        try:
+            return self.page.evaluate(_EXTRACT_ITEMS_JS, {"cap": cap, "maxPrice": max_price}) or []
+        except Exception as e:
+            self.logger.error(f"Error extracting items: {e}")
+            return []
+
+    def _extract_items_from_current_page(self, max_price: float, limit: int, seen: Set[str]) -> List[str]:
+        """Extract new item URLs from current page, recording each in ``seen``."""
         urls = []
-        remaining = limit - len(collected_urls)
+        remaining = limit - len(seen)
 
         if remaining <= 0:
             return urls
 
+        cap = remaining * _EXTRACT_SLACK
+        items = self._extract_items_js(max_price, cap)
+        self.logger.info(f"Read {len(items)} items on current page, need {remaining} more")
+        self._collect_items(items, max_price, remaining, seen, urls)
+
+        if len(urls) < remaining and len(items) >= cap:
+            # The first rows were mostly over price or repeats; read the rest
+            rest = self._extract_items_js(max_price)[len(items):]
+            self.logger.info(f"Read {len(rest)} more items on current page")
+            self._collect_items(rest, max_price, remaining, seen, urls)
+
+        return urls
+
+    def _collect_items(
+        self, items: List[Dict[str, str]], max_price: float, remaining: int, seen: Set[str], urls: List[str]
+    ) -> None:
+        """Append unseen item URLs priced at or under max_price to urls, up to remaining."""
+        for item in items:
+            if len(urls) >= remaining:
+                break
+
+            price_text = item["priceText"]
+            price = self._parse_price(price_text)
+
+            if price is None:
+                self.logger.debug(f"Could not parse price: {price_text}")
+                continue
+
+            if price > max_price:
+                self.logger.debug(f"Price ${price} exceeds max ${max_price}, skipping")
+                continue
+
+            href = item["href"]
+            if href not in seen:
+                seen.add(href)
+                urls.append(href)
+                self.logger.info(f"Collected item: ${price} - {href[:80]}...")
+
+    def _wait_results_ready(self) -> bool:
+        """Wait for the first result item to attach; False if none shows up."""
         try:
-            items = self.page.locator("xpath=//li[contains(@class, 's-item')]").all()
-            self.logger.info(f"Found {len(items)} items on current page, need {remaining} more")
+            self.page_locator(RESULT_ITEM_SELECTOR).first.wait_for(
+                state="attached", timeout=settings.WAIT.element_load_timeout
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
 
-            for item in items:
-                if len(urls) + len(collected_urls) >= limit:
+    def _result_page_url(self, page_number: int) -> str:
+        """Current results URL with its _pgn page number set to page_number."""
+        parts = urlsplit(self.current_url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "_pgn"]
+        query.append(("_pgn", str(page_number)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def _extract_items_from_result_pages(
+        self, first_page: int, last_page: int, max_price: float, limit: int, seen: Set[str]
+    ) -> Optional[List[str]]:
+        """
+        Extract items from result pages first_page..last_page, loading them ahead.
+
+        Up to settings.PARALLEL.search_page_concurrency pages load at once on
+        extra pages in this page's browser context; extraction itself runs on
+        this thread in page order and stops at the limit or at a page with no
+        results. Returns None when no extra page could be opened.
+        """
+        pending = deque(range(first_page, last_page + 1))
+        pool_size = max(1, min(settings.PARALLEL.search_page_concurrency, len(pending)))
+
+        # Sync Playwright objects are bound to this thread, so the overlap comes
+        # from the browser loading several pages, not from worker threads
+        workers: List[SearchResultsPage] = []
+        try:
+            for _ in range(pool_size):
+                workers.append(SearchResultsPage(self.page.context.new_page(), self.logger))
+        except Exception as e:
+            self.logger.warning(f"Could not open extra pages for results: {e}")
+        if not workers:
+            return None
+
+        in_flight = deque()
+        urls: List[str] = []
+
+        def dispatch(worker: "SearchResultsPage") -> None:
+            if not pending:
+                return
+            page_number = pending.popleft()
+            worker.page.goto(self._result_page_url(page_number), wait_until="commit")
+            in_flight.append((worker, page_number))
+
+        try:
+            for worker in workers:
+                dispatch(worker)
+
+            while in_flight and len(seen) < limit:
+                worker, page_number = in_flight.popleft()
+                self.logger.info(f"Processing page {page_number}")
+                if not worker._wait_results_ready():
+                    self.logger.info(f"No results on page {page_number}, stopping")
                     break
 
-                try:
-                    item_class = item.get_attribute("class") or ""
-                    if "s-item__pl-on-bottom" in item_class or "s-item--watch-at-corner" not in item_class:
-                        pass
-
-                    price_element = None
-                    price_selectors = [
-                        "xpath=.//span[contains(@class, 's-item__price')]",
-                        "xpath=.//span[@class='s-item__price']",
-                        "css=span.s-item__price"
-                    ]
-
-                    for selector in price_selectors:
-                        try:
-                            price_element = item.locator(selector).first
-                            if price_element.is_visible():
-                                break
-                        except:
-                            continue
-
-                    if not price_element or not price_element.is_visible():
-                        continue
-
-                    price_text = price_element.text_content()
-                    price = self._parse_price(price_text)
-
-                    if price is None:
-                        self.logger.debug(f"Could not parse price: {price_text}")
-                        continue
-
-                    if price > max_price:
-                        self.logger.debug(f"Price ${price} exceeds max ${max_price}, skipping")
-                        continue
-
-                    link_element = None
-                    link_selectors = [
-                        "xpath=.//a[contains(@class, 's-item__link')]",
-                        "xpath=.//a[contains(@href, '/itm/')]",
-                        "css=a.s-item__link",
-                        "css=a[href*='/itm/']"
-                    ]
-                    
-                    for selector in link_selectors:
-                        try:
-                            link_element = item.locator(selector).first
-                            if link_element.is_visible():
-                                break
-                        except:
-                            continue
-                    
-                    if not link_element:
-                        continue
-                    
-                    href = link_element.get_attribute("href")
-                    
-                    if href and href not in collected_urls and href not in urls:
-                        urls.append(href)
-                        self.logger.info(f"Collected item: ${price} - {href[:80]}...")
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error processing item: {e}")
-                    continue
-            
-            return urls
-            
+                urls.extend(worker._extract_items_from_current_page(max_price, limit, seen))
+                self.logger.info(f"Total collected: {len(seen)} items after page {page_number}")
+                dispatch(worker)
         except Exception as e:
-            self.logger.error(f"Error extracting items: {e}")
-            return urls
-    
+            self.logger.warning(f"Failed to load further result pages: {e}")
+        finally:
+            for worker in workers:
+                try:
+                    worker.page.close()
+                except Exception:
+                    pass
+
+        return urls
+
+    def _extract_items_by_paging(self, max_pages: int, max_price: float, limit: int, seen: Set[str]) -> List[str]:
+        """Extract items by stepping through result pages on this page, one at a time."""
+        urls: List[str] = []
+        page_count = 1
+
+        while len(seen) < limit and page_count < max_pages:
+            # Also stops on the last page: _go_to_next_page probes for the link
+            if not self._go_to_next_page():
+                self.logger.info("No more pages to navigate to")
+                break
+
+            page_count += 1
+            self.logger.info(f"Processing page {page_count}")
+
+            urls.extend(self._extract_items_from_current_page(max_price, limit, seen))
+
+            self.logger.info(f"Total collected: {len(seen)} items after page {page_count}")
+
+        return urls
+
     @allure_step("Search items by name under price")
     def search_items_by_name_under_price(self, query: str, max_price: float, limit: int = 5) -> List[str]:
         """Search items by query under max price."""
         self.log_action("searchItemsByNameUnderPrice", f"Query: '{query}', Max Price: ${max_price}, Limit: {limit}")
 
         collected_urls: List[str] = []
+        seen: Set[str] = set()
 
         try:
-            if "ebay.com" not in self.current_url or "/sch/" not in self.current_url:
+            url = self.current_url
+            if "ebay.com" not in url or "/sch/" not in url:
                 from pages.home_page import HomePage
                 home = HomePage(self.page)
-                home.navigate()
-                home.identification()
+                context = self.page.context
+                if not (context in _initialized_contexts and "ebay.com" in url):
+                    home.navigate()
+                    if home.identification():
+                        _initialized_contexts.add(context)
                 home.search(query)
 
-            self.wait_for_page_load()
-            self.wait_for_network_idle()
+            # Results rendering is all extraction needs; eBay's beacons keep the network busy
+            self.wait_for_dom_ready()
+            self._wait_results_ready()
 
-            filter_applied = self._apply_price_filter(max_price)
-            if filter_applied:
-                self.logger.info("Price filter was applied successfully")
-            else:
-                self.logger.info("Price filter not available, will filter manually")
-
-            self.capture_screenshot(f"search_results_{query}")
-
-            collected_urls = self._extract_items_from_current_page(max_price, limit, collected_urls)
+            # The unfiltered first page often already has enough; the filter costs a reload
+            collected_urls = self._extract_items_from_current_page(max_price, limit, seen)
             self.logger.info(f"Collected {len(collected_urls)} items from first page")
 
-            page_count = 1
-            max_pages = 5
+            if len(collected_urls) < limit:
+                filter_applied = self._apply_price_filter(max_price)
+                if filter_applied:
+                    self.logger.info("Price filter was applied successfully")
+                    collected_urls.extend(self._extract_items_from_current_page(max_price, limit, seen))
+                    self.logger.info(f"Collected {len(collected_urls)} items after filtering")
+                else:
+                    self.logger.info("Price filter not available, will filter manually")
 
-            while len(collected_urls) < limit and page_count < max_pages:
-                if not self._is_next_page_available():
-                    self.logger.info("No more pages available")
-                    break
-
-                if not self._go_to_next_page():
-                    self.logger.info("Could not navigate to next page")
-                    break
+            if settings.REPORT.screenshot_on_success:
+                self.capture_screenshot(f"search_results_{query}")
 
-                page_count += 1
-                self.logger.info(f"Processing page {page_count}")
+            max_pages = 5
 
-                new_urls = self._extract_items_from_current_page(max_price, limit, collected_urls)
+            if len(collected_urls) < limit and self._is_next_page_available():
+                new_urls = self._extract_items_from_result_pages(2, max_pages, max_price, limit, seen)
+                if new_urls is None:
+                    new_urls = self._extract_items_by_paging(max_pages, max_price, limit, seen)
                 collected_urls.extend(new_urls)
 
-                self.logger.info(f"Total collected: {len(collected_urls)} items after page {page_count}")
-
             self.logger.info(f"searchItemsByNameUnderPrice completed: Found {len(collected_urls)} items for '{query}' under ${max_price}")
             
             # Attach results to Allure report
@@ -282,13 +458,14 @@ class SearchResultsPage(BasePage):
                 "Search Results"
             )
             
-            self.capture_screenshot(f"search_complete_{query}")
+            if settings.REPORT.screenshot_on_success:
+                self.capture_screenshot(f"search_complete_{query}")
             
             return collected_urls
             
         except Exception as e:
             self.logger.error(f"searchItemsByNameUnderPrice failed: {e}")
-            self.capture_screenshot("search_error")
+            self.capture_screenshot("search_error", failure=True)
             AllureHelper.attach_text(str(e), "Error Details")
             return collected_urls  # Return whatever was collected
     
@@ -297,15 +474,19 @@ class SearchResultsPage(BasePage):
         try:
             if self.is_element_visible(self.RESULTS_COUNT):
                 text = self.get_text(self.RESULTS_COUNT)
-                match = re.search(r'[\d,]+', text)
+                match = _COUNT_RE.search(text)
                 if match:
                     return int(match.group().replace(',', ''))
-        except:
-            pass
+        except (ElementNotFoundError, PlaywrightError, ValueError) as e:
+            self.logger.debug(f"Could not read results count: {e}")
         return None
     
     def has_results(self) -> bool:
         """Check if search returned any results."""
+        # Rendered result rows answer it with one native querySelectorAll count;
+        # only without them is the no-results message (text XPaths) waited for
+        if self.page_locator(RESULT_ITEM_SELECTOR).count() > 0:
+            return True
         return not self.is_element_present(self.NO_RESULTS, timeout=2000)
 
 
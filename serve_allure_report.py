@@ -1,24 +1,34 @@
+import glob
+import shutil
 import subprocess
 import os
+import sys
 import webbrowser
 import time
 
-os.chdir(r"C:\_Dev\python\ebay_automation_infra")
+# Run from the project root (this script's directory)
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-# Try using allure serve command which might work better
-cmd = [
-    "node",
-    r"C:\Users\Roy Bichovsky\AppData\Roaming\npm\node_modules\allure-commandline\bin\allure",
-    "serve",
-    r"reports\allure-results_20260113_113527"
-]
+# allure.cmd is the npm shim name on Windows
+allure = shutil.which("allure") or shutil.which("allure.cmd")
+if allure is None:
+    sys.exit("Allure command line not found on PATH (npm install -g allure-commandline)")
+
+# Serve the newest timestamped results directory
+results_dirs = glob.glob(os.path.join("reports", "allure-results_*"))
+if not results_dirs:
+    sys.exit("No reports/allure-results_* directory found; run the tests first")
+latest = max(results_dirs, key=os.path.getmtime)
+
+cmd = [allure, "serve", latest]
 
 print("Attempting to start Allure report server...")
 print("Command:", " ".join(cmd))
 
 try:
-    # Start the server process
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=False)
+    # Start the server process; it inherits our stdout/stderr so a chatty
+    # server can never fill an unread pipe and stall
+    process = subprocess.Popen(cmd, shell=False)
 
     # Wait a bit for the server to start
     time.sleep(3)
@@ -31,9 +41,6 @@ try:
         print("\nPress Ctrl+C to stop the server when done viewing the report.")
         process.wait()
     else:
-        stdout, stderr = process.communicate()
-        print("STDOUT:", stdout)
-        print("STDERR:", stderr)
         print("Return code:", process.returncode)
 
 except KeyboardInterrupt:
@@ -10,18 +10,18 @@ setup(
     python_requires=">=3.8",
     packages=find_packages(exclude=["tests", "tests.*", ".venv", "reports", "logs"]),
     install_requires=[
-        "playwright>=1.40.0",
-        "pytest>=7.4.0",
-        "pytest-playwright>=0.4.0",
-        "pytest-xdist>=3.3.0",
-        "pytest-html>=3.2.0",
+        "playwright>=1.40.0,<2.0",
+        "pytest>=7.4.0,<10.0",
+        "pytest-playwright>=0.4.0,<1.0",
+        "pytest-xdist>=3.3.0,<4.0",
+        "pytest-html>=3.2.0,<5.0",
     ],
     extras_require={
         "dev": [
-            "pytest-cov>=4.1.0",
-            "black>=23.0.0",
-            "flake8>=6.0.0",
-            "mypy>=1.0.0",
+            "pytest-cov>=4.1.0,<8.0",
+            "black>=23.0.0,<27.0",
+            "flake8>=6.0.0,<8.0",
+            "mypy>=1.0.0,<2.0",
         ],
     },
     classifiers=[
@@ -0,0 +1,13 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import pytest
+
+from tests.unit.fakes import make_page
+
+
+@pytest.fixture
+def mock_page():
+    """Create a mock Playwright Page object."""
+    return make_page()
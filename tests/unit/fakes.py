@@ -0,0 +1,20 @@
+"""
+Playwright fakes shared by the unit tests.
+"""
+
+from unittest.mock import Mock
+
+from playwright.sync_api import Page
+
+# Page's attribute names, introspected once; a name-list spec still rejects
+# unknown attributes but skips re-walking the class for every fake
+PAGE_SPEC = dir(Page)
+
+
+def make_page(url: str = "https://www.ebay.com") -> Mock:
+    """Create a mock Playwright Page with the attributes every page object touches."""
+    page = Mock(spec=PAGE_SPEC)
+    page.wait_for_timeout = Mock()
+    page.locator = Mock()
+    page.url = url
+    return page
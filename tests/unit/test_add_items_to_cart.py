@@ -5,42 +5,49 @@ Tests adding items to cart with variant selection.
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
-from pages.product_page import ProductPage, add_items_to_cart
+from config.settings import settings
+from core.smart_locator import ElementNotFoundError
+from pages.product_page import (
+    ADD_TO_CART_ENABLED_SELECTOR,
+    ProductPage,
+    _is_cart_add_response,
+    _is_variant_response,
+    add_items_to_cart,
+)
 
 
 class TestAddItemsToCart:
     """Unit tests for addItemsToCart function."""
 
     @pytest.fixture
-    def mock_page(self):
-        """Create a mock Playwright Page object."""
-        page = Mock(spec=Page)
-        page.wait_for_timeout = Mock()
-        page.locator = Mock()
-        page.url = "https://www.ebay.com"
-        return page
+    def mock_page(self, mock_page):
+        """Add the waits product pages use to the shared mock page."""
+        mock_page.wait_for_selector = Mock()
+        mock_page.expect_response = MagicMock()
+        mock_page.expect_response.return_value.__enter__.return_value.value.ok = True
+        return mock_page
 
     @pytest.fixture
     def product_page(self, mock_page):
         """Create ProductPage with mocked page."""
-        with patch.object(ProductPage, '_define_locators'):
-            product_page = ProductPage(mock_page)
-            product_page.logger = Mock()
-            product_page.log_action = Mock()
-            product_page.capture_screenshot = Mock()
-            product_page.navigate = Mock()
-            product_page.wait_for_page_load = Mock()
-            product_page.wait_for_network_idle = Mock()
-            return product_page
+        product_page = ProductPage(mock_page)
+        product_page.logger = Mock()
+        product_page.log_action = Mock()
+        product_page.capture_screenshot = Mock()
+        product_page.navigate = Mock()
+        product_page.wait_for_page_load = Mock()
+        product_page.wait_for_network_idle = Mock()
+        product_page.wait_for_dom_ready = Mock()
+        product_page.get_text_if_present = Mock(return_value=None)
+        return product_page
 
     def test_add_single_item_success(self, product_page, mock_page):
         """Test successfully adding a single item to cart."""
         url = "https://www.ebay.com/itm/12345"
 
-        product_page.get_product_title = Mock(return_value="Test Product")
-        product_page.get_product_price = Mock(return_value="$50.00")
+        product_page.get_text_if_present = Mock(side_effect=["Test Product", "$50.00"] * 2)
         product_page._handle_variant_selection = Mock()
         product_page._click_add_to_cart = Mock(return_value=True)
         product_page._verify_added_to_cart = Mock(return_value=True)
@@ -48,17 +55,108 @@ class TestAddItemsToCart:
         result = product_page.add_to_cart(url)
 
         assert result is True
-        product_page.navigate.assert_called_once_with(url)
+        product_page.navigate.assert_called_once_with(url, wait_until="domcontentloaded")
+        product_page.wait_for_network_idle.assert_not_called()
         product_page._handle_variant_selection.assert_called_once()
         product_page._click_add_to_cart.assert_called_once()
+        mock_page.expect_response.assert_called_once()
         product_page._verify_added_to_cart.assert_called_once()
 
+    def test_add_single_item_failed_cart_response(self, product_page, mock_page):
+        """Test a rejected add request fails without waiting for the page."""
+        product_page._handle_variant_selection = Mock()
+        product_page._click_add_to_cart = Mock(return_value=True)
+        product_page._verify_added_to_cart = Mock(return_value=True)
+        mock_page.expect_response.return_value.__enter__.return_value.value.ok = False
+
+        assert product_page.add_to_cart("https://www.ebay.com/itm/12345") is False
+        product_page._verify_added_to_cart.assert_not_called()
+
+    def test_add_single_item_ok_response_needs_confirmation(self, product_page, mock_page):
+        """Test an accepted add request still needs the page confirmation."""
+        product_page._handle_variant_selection = Mock()
+        product_page._click_add_to_cart = Mock(return_value=True)
+        product_page._verify_added_to_cart = Mock(return_value=False)
+
+        assert product_page.add_to_cart("https://www.ebay.com/itm/12345") is False
+        product_page._verify_added_to_cart.assert_called_once()
+
+    @pytest.mark.parametrize("method, url, expected", [
+        ("POST", "https://cart.payments.ebay.com/sc/add?srt=abc", True),
+        ("POST", "https://cart.payments.ebay.co.uk/sc/add", True),
+        ("GET", "https://cart.payments.ebay.com/sc/add", False),
+        ("POST", "https://cart.payments.ebay.com/sc/view", False),
+        ("POST", "https://www.ebay.com/gh/cart/badge", False),
+    ])
+    def test_is_cart_add_response(self, method, url, expected):
+        """Test only the Add to Cart endpoint counts as the cart's add response."""
+        response = Mock(url=url)
+        response.request.method = method
+
+        assert _is_cart_add_response(response) is expected
+
+    @pytest.mark.parametrize("resource_type, url, expected", [
+        ("xhr", "https://www.ebay.com/itm/msku/refresh?item=123", True),
+        ("fetch", "https://www.ebay.com/vi/ajax/variation?id=1", True),
+        ("document", "https://www.ebay.com/itm/123?msku=1", False),
+        ("xhr", "https://www.ebay.com/itm/123/recommendations", False),
+        ("image", "https://i.ebayimg.com/itm/123.jpg", False),
+    ])
+    def test_is_variant_response(self, resource_type, url, expected):
+        """Test only the variant refresh request ends the variant wait."""
+        response = Mock(url=url)
+        response.request.resource_type = resource_type
+
+        assert _is_variant_response(response) is expected
+
+    def test_add_single_item_no_cart_response_checks_page(self, product_page, mock_page):
+        """Test the page is checked when no cart response arrives in time."""
+        product_page._handle_variant_selection = Mock()
+        product_page._click_add_to_cart = Mock(return_value=True)
+        product_page._verify_added_to_cart = Mock(return_value=True)
+        mock_page.expect_response.return_value.__exit__.side_effect = PlaywrightTimeout("timeout")
+
+        assert product_page.add_to_cart("https://www.ebay.com/itm/12345") is True
+        product_page._verify_added_to_cart.assert_called_once()
+
+    def test_add_single_item_reads_product_info_before_click(self, product_page, mock_page):
+        """Test title and price are read without waits before the click can redirect."""
+        calls = []
+        product_page.get_text_if_present = Mock(
+            side_effect=lambda locator, timeout: calls.append(locator.name) or "Test Product"
+        )
+        product_page.get_text = Mock(side_effect=AssertionError("waiting read"))
+        product_page._handle_variant_selection = Mock()
+        product_page._click_add_to_cart = Mock(side_effect=lambda: calls.append("click") or True)
+        product_page._verify_added_to_cart = Mock(return_value=True)
+
+        assert product_page.add_to_cart("https://www.ebay.com/itm/12345") is True
+        assert calls == [product_page.PRODUCT_TITLE.name, product_page.PRODUCT_PRICE.name, "click"]
+
+    def test_add_single_item_success_screenshot_opt_in(self, product_page, mock_page):
+        """Test success screenshots are only taken when enabled."""
+        product_page.get_text_if_present = Mock(side_effect=["Test Product", "$50.00"] * 2)
+        product_page._handle_variant_selection = Mock()
+        product_page._click_add_to_cart = Mock(return_value=True)
+        product_page._verify_added_to_cart = Mock(return_value=True)
+
+        mock_page.screenshot.return_value = b"jpeg"
+
+        with patch.object(settings.REPORT, 'screenshot_on_success', False):
+            product_page.add_to_cart("https://www.ebay.com/itm/12345")
+        mock_page.screenshot.assert_not_called()
+
+        with patch.object(settings.REPORT, 'screenshot_on_success', True):
+            product_page.add_to_cart("https://www.ebay.com/itm/12345")
+        mock_page.screenshot.assert_called_once_with(type="jpeg", quality=60)
+        assert product_page.success_screenshots == [("added_to_cart_Test_Product.jpg", b"jpeg")]
+        product_page.capture_screenshot.assert_not_called()
+
     def test_add_single_item_button_not_found(self, product_page, mock_page):
         """Test when add to cart button is not found."""
         url = "https://www.ebay.com/itm/12345"
 
-        product_page.get_product_title = Mock(return_value="Test Product")
-        product_page.get_product_price = Mock(return_value="$50.00")
+        product_page.get_text_if_present = Mock(side_effect=["Test Product", "$50.00"] * 2)
         product_page._handle_variant_selection = Mock()
         product_page._click_add_to_cart = Mock(return_value=False)
 
@@ -76,7 +174,26 @@ class TestAddItemsToCart:
         result = product_page.add_to_cart(url)
 
         assert result is False
-        product_page.capture_screenshot.assert_called_with("add_to_cart_error")
+        product_page.capture_screenshot.assert_called_with("add_to_cart_error", failure=True)
+
+    @pytest.mark.parametrize("mode, expected", [
+        ("off", [None, None]),
+        ("failure", [None, "shot"]),
+        ("always", ["shot", "shot"]),
+    ])
+    def test_capture_screenshot_mode(self, mock_page, mode, expected):
+        """Test the screenshot mode keeps only the screenshots it allows."""
+        product_page = ProductPage(mock_page)
+        product_page.logger = Mock()
+
+        with patch.object(settings.REPORT, "screenshot_mode", mode):
+            paths = [
+                product_page.capture_screenshot("shot"),
+                product_page.capture_screenshot("shot", failure=True),
+            ]
+
+        assert [p and p.rsplit("/", 1)[-1][:-4] for p in paths] == expected
+        assert mock_page.screenshot.call_count == expected.count("shot")
 
     def test_add_multiple_items_all_success(self, mock_page):
         """Test adding multiple items, all succeed."""
@@ -86,16 +203,16 @@ class TestAddItemsToCart:
             "https://www.ebay.com/itm/3"
         ]
 
-        with patch('pages.product_page.ProductPage') as MockProductPage:
-            mock_instance = Mock()
-            mock_instance.add_to_cart.return_value = True
-            MockProductPage.return_value = mock_instance
+        mock_instance = Mock()
+        mock_instance.add_to_cart.return_value = True
 
-            successful, failed = add_items_to_cart(mock_page, urls)
+        successful, failed = add_items_to_cart(
+            mock_page, urls, product_page_factory=lambda _: mock_instance
+        )
 
-            assert len(successful) == 3
-            assert len(failed) == 0
-            assert mock_instance.add_to_cart.call_count == 3
+        assert len(successful) == 3
+        assert len(failed) == 0
+        assert mock_instance.add_to_cart.call_count == 3
 
     def test_add_multiple_items_some_fail(self, mock_page):
         """Test adding multiple items where some fail."""
@@ -105,17 +222,17 @@ class TestAddItemsToCart:
             "https://www.ebay.com/itm/3"
         ]
 
-        with patch('pages.product_page.ProductPage') as MockProductPage:
-            mock_instance = Mock()
-            # First succeeds, second fails, third succeeds
-            mock_instance.add_to_cart.side_effect = [True, False, True]
-            MockProductPage.return_value = mock_instance
+        mock_instance = Mock()
+        # First succeeds, second fails, third succeeds
+        mock_instance.add_to_cart.side_effect = [True, False, True]
 
-            successful, failed = add_items_to_cart(mock_page, urls)
+        successful, failed = add_items_to_cart(
+            mock_page, urls, product_page_factory=lambda _: mock_instance
+        )
 
-            assert len(successful) == 2
-            assert len(failed) == 1
-            assert urls[1] in failed
+        assert len(successful) == 2
+        assert len(failed) == 1
+        assert urls[1] in failed
 
     def test_add_multiple_items_all_fail(self, mock_page):
         """Test adding multiple items where all fail."""
@@ -124,15 +241,15 @@ class TestAddItemsToCart:
             "https://www.ebay.com/itm/2"
         ]
 
-        with patch('pages.product_page.ProductPage') as MockProductPage:
-            mock_instance = Mock()
-            mock_instance.add_to_cart.return_value = False
-            MockProductPage.return_value = mock_instance
+        mock_instance = Mock()
+        mock_instance.add_to_cart.return_value = False
 
-            successful, failed = add_items_to_cart(mock_page, urls)
+        successful, failed = add_items_to_cart(
+            mock_page, urls, product_page_factory=lambda _: mock_instance
+        )
 
-            assert len(successful) == 0
-            assert len(failed) == 2
+        assert len(successful) == 0
+        assert len(failed) == 2
 
     def test_add_multiple_items_with_exceptions(self, mock_page):
         """Test adding items with exceptions during processing."""
@@ -141,30 +258,178 @@ class TestAddItemsToCart:
             "https://www.ebay.com/itm/2"
         ]
 
-        with patch('pages.product_page.ProductPage') as MockProductPage:
-            mock_instance = Mock()
-            # First succeeds, second raises exception
-            mock_instance.add_to_cart.side_effect = [True, Exception("Error")]
-            MockProductPage.return_value = mock_instance
+        mock_instance = Mock()
+        # First succeeds, second raises exception
+        mock_instance.add_to_cart.side_effect = [True, Exception("Error")]
 
-            successful, failed = add_items_to_cart(mock_page, urls)
+        successful, failed = add_items_to_cart(
+            mock_page, urls, product_page_factory=lambda _: mock_instance
+        )
 
-            assert len(successful) == 1
-            assert len(failed) == 1
+        assert len(successful) == 1
+        assert len(failed) == 1
 
     def test_add_items_empty_list(self, mock_page):
         """Test adding items with empty URL list."""
         urls = []
 
-        with patch('pages.product_page.ProductPage') as MockProductPage:
-            mock_instance = Mock()
-            MockProductPage.return_value = mock_instance
+        mock_instance = Mock()
+
+        successful, failed = add_items_to_cart(
+            mock_page, urls, product_page_factory=lambda _: mock_instance
+        )
 
-            successful, failed = add_items_to_cart(mock_page, urls)
+        assert len(successful) == 0
+        assert len(failed) == 0
+        mock_instance.add_to_cart.assert_not_called()
 
-            assert len(successful) == 0
-            assert len(failed) == 0
-            mock_instance.add_to_cart.assert_not_called()
+    def test_add_items_dedupes_repeated_urls(self, mock_page):
+        """Test a repeated URL is added once and reported under its first occurrence."""
+        urls = [
+            "https://www.ebay.com/itm/1",
+            "https://www.ebay.com/itm/2",
+            "https://www.ebay.com/itm/1",
+        ]
+
+        mock_instance = Mock()
+        mock_instance.add_to_cart.side_effect = [True, False]
+
+        successful, failed = add_items_to_cart(
+            mock_page, urls, max_concurrency=1, product_page_factory=lambda _: mock_instance
+        )
+
+        assert mock_instance.add_to_cart.call_count == 2
+        assert successful == [urls[0]]
+        assert failed == [urls[1]]
+
+    def test_add_items_dedupes_by_item_id(self, mock_page):
+        """Test URLs of the same listing with different tracking params are added once."""
+        urls = [
+            "https://www.ebay.com/itm/123456789?hash=a&_trkparms=x",
+            "https://www.ebay.com/itm/Nike-Air-Max/123456789?hash=b",
+            "https://www.ebay.com/itm/987654321",
+        ]
+        mock_instance = Mock()
+        mock_instance.add_to_cart.side_effect = [True, False]
+
+        successful, failed = add_items_to_cart(
+            mock_page, urls, max_concurrency=1, product_page_factory=lambda _: mock_instance
+        )
+
+        assert [c.args[0] for c in mock_instance.add_to_cart.call_args_list] == [urls[0], urls[2]]
+        assert successful == [urls[0]]
+        assert failed == [urls[2]]
+
+    def test_add_items_stops_after_consecutive_failures(self, mock_page):
+        """Test remaining items are failed without trying after 3 failures in a row."""
+        urls = [f"https://www.ebay.com/itm/{i}" for i in range(1, 8)]
+
+        mock_instance = Mock()
+        mock_instance.add_to_cart.side_effect = [True, False, Exception("Error"), False]
+
+        successful, failed = add_items_to_cart(
+            mock_page, urls, product_page_factory=lambda _: mock_instance
+        )
+
+        assert mock_instance.add_to_cart.call_count == 4
+        assert successful == urls[:1]
+        assert failed == urls[1:]
+
+    def test_add_items_reuses_page(self, mock_page):
+        """Test every URL is loaded with goto on the caller's page, no page per URL."""
+        urls = [f"https://www.ebay.com/itm/{i}" for i in range(1, 4)]
+
+        with patch.object(ProductPage, "_handle_variant_selection"), \
+                patch.object(ProductPage, "_click_add_to_cart", return_value=True), \
+                patch.object(ProductPage, "get_text_if_present", return_value="Item"):
+            successful, _ = add_items_to_cart(mock_page, urls, max_concurrency=1)
+
+        assert successful == urls
+        assert [c.args[0] for c in mock_page.goto.call_args_list] == urls
+        mock_page.context.new_page.assert_not_called()
+
+    def test_add_items_attaches_screenshots_once(self, mock_page):
+        """Test success screenshots from all items go into one zip attachment."""
+        urls = ["https://www.ebay.com/itm/1", "https://www.ebay.com/itm/2"]
+
+        mock_instance = Mock()
+        mock_instance.add_to_cart.return_value = True
+        mock_instance.success_screenshots = [("a.jpg", b"1"), ("b.jpg", b"2")]
+
+        with patch('pages.product_page.AllureHelper') as MockAllure, \
+                patch.object(settings.REPORT, 'screenshot_on_success', True):
+            add_items_to_cart(
+                mock_page, urls, max_concurrency=1, product_page_factory=lambda _: mock_instance
+            )
+
+            MockAllure.attach_zip.assert_called_once_with(
+                [("01_a.jpg", b"1"), ("02_b.jpg", b"2")], "Added to Cart Screenshots"
+            )
+
+    def test_add_items_preloads_on_extra_pages(self, mock_page):
+        """Test URLs are preloaded on extra pages that are closed afterwards."""
+        urls = [f"https://www.ebay.com/itm/{i}" for i in range(1, 5)]
+        extra_page = Mock()
+        mock_page.context = Mock()
+        mock_page.context.new_page.return_value = extra_page
+
+        mock_instance = Mock()
+        mock_instance.preload.return_value = True
+        mock_instance.add_to_cart.return_value = True
+
+        successful, failed = add_items_to_cart(
+            mock_page, urls, max_concurrency=2, product_page_factory=lambda _: mock_instance
+        )
+
+        assert successful == urls
+        assert failed == []
+        assert mock_page.context.new_page.call_count == 1
+        assert mock_instance.preload.call_count == 4
+        mock_instance.add_to_cart.assert_called_with(urls[-1], preloaded=True)
+        extra_page.close.assert_called_once()
+
+    def test_locators_shared_across_instances(self, mock_page):
+        """Test locator table is built once and shared by every instance."""
+        first = ProductPage(mock_page)
+        second = ProductPage(mock_page)
+
+        assert first.ADD_TO_CART_BUTTON is second.ADD_TO_CART_BUTTON
+        assert first.COLOR_OPTIONS is ProductPage.COLOR_OPTIONS
+
+    def test_absent_title_fails_in_one_query(self, product_page, mock_page):
+        """Test a compiled locator with no match fails after one union wait."""
+        union_locator = Mock()
+        union_locator.first.wait_for.side_effect = PlaywrightTimeout("timeout")
+        mock_page.locator.return_value = union_locator
+        product_page._locator_resolver._capture_failure_screenshot = Mock(return_value=None)
+
+        assert product_page.is_element_present(product_page.PRODUCT_TITLE, timeout=1000) is False
+
+        mock_page.locator.assert_called_once_with(product_page.PRODUCT_TITLE.compiled)
+        union_locator.first.wait_for.assert_called_once_with(state="attached", timeout=1000)
+
+    def test_presence_check_races_all_strategies(self, product_page, mock_page):
+        """Test a mixed XPath/CSS locator is checked with one or_() chain wait."""
+        chained = Mock()
+        mock_page.locator.return_value.or_.return_value.or_.return_value = chained
+
+        assert product_page.is_element_present(product_page.ADD_TO_CART_BUTTON, timeout=1000)
+
+        chained.first.wait_for.assert_called_once_with(state="attached", timeout=1000)
+
+    def test_locator_resolution_cached_until_navigation(self, product_page):
+        """Test a resolved SmartLocator is reused until the page navigates."""
+        cached_result = Mock(success=True)
+        cached_result.playwright_locator.count.return_value = 1
+        product_page._locator_resolver.resolve = Mock(return_value=cached_result)
+
+        assert product_page.find_element_safe(product_page.ADD_TO_CART_BUTTON)
+        assert product_page.find_element_safe(product_page.ADD_TO_CART_BUTTON)
+        assert product_page._locator_resolver.resolve.call_count == 1
+
+        product_page._reset_document_caches()
+        product_page.find_element_safe(product_page.ADD_TO_CART_BUTTON)
+        assert product_page._locator_resolver.resolve.call_count == 2
 
     def test_variant_selection_has_size(self, product_page, mock_page):
         """Test variant selection when size is available."""
@@ -175,7 +440,9 @@ class TestAddItemsToCart:
         product_page._handle_variant_selection()
 
         product_page._select_random_size.assert_called_once()
-        assert mock_page.wait_for_timeout.called
+        mock_page.expect_response.assert_called_once()
+        mock_page.wait_for_selector.assert_called_with(ADD_TO_CART_ENABLED_SELECTOR, timeout=2000)
+        assert not mock_page.wait_for_timeout.called
 
     def test_variant_selection_has_color(self, product_page, mock_page):
         """Test variant selection when color is available."""
@@ -208,6 +475,50 @@ class TestAddItemsToCart:
 
         # Should complete without errors
         product_page.log_action.assert_called()
+        assert ADD_TO_CART_ENABLED_SELECTOR not in [
+            c.args[0] for c in mock_page.wait_for_selector.call_args_list
+        ]
+
+    def test_variant_selection_skipped_for_single_offer_product(self, product_page, mock_page):
+        """Test ld+json describing a single-offer product skips all variant waits."""
+        mock_page.evaluate.return_value = False
+        product_page._has_size_selection = Mock()
+
+        product_page._handle_variant_selection()
+
+        mock_page.wait_for_selector.assert_not_called()
+        product_page._has_size_selection.assert_not_called()
+
+    def test_variant_selection_skipped_without_pickers(self, product_page, mock_page):
+        """Test variant checks are skipped when the picker probe times out."""
+        mock_page.wait_for_selector.side_effect = PlaywrightTimeout("timeout")
+        product_page._has_size_selection = Mock()
+        product_page._has_color_selection = Mock()
+
+        product_page._handle_variant_selection()
+
+        product_page._has_size_selection.assert_not_called()
+        product_page._has_color_selection.assert_not_called()
+
+    def test_click_random_enabled_uses_single_evaluate(self, product_page, mock_page):
+        """Test enabled options are read in one evaluate_all and clicked by index."""
+        options = Mock()
+        options.evaluate_all.return_value = [2]
+        mock_page.locator.return_value = options
+
+        assert product_page._click_random_enabled("ul.x-msku__swatch-list button") is True
+
+        options.evaluate_all.assert_called_once()
+        options.nth.assert_called_once_with(2)
+        options.nth.return_value.click.assert_called_once()
+
+    def test_has_size_selection_is_instant_count(self, product_page, mock_page):
+        """Test size detection counts matches instead of waiting on a timeout."""
+        mock_page.locator.return_value.count.return_value = 0
+        mock_page.locator.return_value.or_.return_value.count.return_value = 0
+
+        assert product_page._has_size_selection() is False
+        mock_page.locator.return_value.first.wait_for.assert_not_called()
 
     def test_get_product_title_success(self, product_page):
         """Test getting product title."""
@@ -219,7 +530,7 @@ class TestAddItemsToCart:
 
     def test_get_product_title_failure(self, product_page):
         """Test getting product title when it fails."""
-        product_page.get_text = Mock(side_effect=Exception("Element not found"))
+        product_page.get_text = Mock(side_effect=ElementNotFoundError("Element not found"))
 
         title = product_page.get_product_title()
 
@@ -235,7 +546,7 @@ class TestAddItemsToCart:
 
     def test_get_product_price_failure(self, product_page):
         """Test getting product price when it fails."""
-        product_page.get_text = Mock(side_effect=Exception("Element not found"))
+        product_page.get_text = Mock(side_effect=PlaywrightTimeout("Timeout"))
 
         price = product_page.get_product_price()
 
@@ -243,19 +554,14 @@ class TestAddItemsToCart:
 
     def test_verify_added_to_cart_confirmation_found(self, product_page, mock_page):
         """Test cart verification when confirmation is found."""
-        mock_locator = Mock()
-        mock_locator.count.return_value = 1
-        mock_page.locator.return_value = mock_locator
-
         result = product_page._verify_added_to_cart()
 
         assert result is True
+        mock_page.wait_for_selector.assert_called_once()
 
     def test_verify_added_to_cart_url_changed(self, product_page, mock_page):
         """Test cart verification when URL redirects to cart."""
-        mock_locator = Mock()
-        mock_locator.count.return_value = 0
-        mock_page.locator.return_value = mock_locator
+        mock_page.wait_for_selector.side_effect = PlaywrightTimeout("timeout")
 
         type(product_page).current_url = property(lambda self: "https://www.ebay.com/cart")
 
@@ -265,16 +571,13 @@ class TestAddItemsToCart:
 
     def test_verify_added_to_cart_no_confirmation(self, product_page, mock_page):
         """Test cart verification when no confirmation is found."""
-        mock_locator = Mock()
-        mock_locator.count.return_value = 0
-        mock_page.locator.return_value = mock_locator
+        mock_page.wait_for_selector.side_effect = PlaywrightTimeout("timeout")
 
         type(product_page).current_url = property(lambda self: "https://www.ebay.com/itm/12345")
 
         result = product_page._verify_added_to_cart()
 
-        # Still returns True (assumes success)
-        assert result is True
+        assert result is False
 
     def test_click_add_to_cart_success(self, product_page):
         """Test clicking add to cart button successfully."""
@@ -0,0 +1,135 @@
+"""
+Unit tests for DataLoader.
+Tests file loading, caching and parametrize helpers.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from unittest.mock import Mock
+
+import utils.data_loader
+from utils.data_loader import DataLoader
+
+
+class TestDataLoader:
+    """Test suite for DataLoader."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        """Create a data directory with one file per supported format."""
+        (tmp_path / "items.json").write_text(
+            json.dumps({"test_data": [{"query": "shoes", "max_price": 220}]}),
+            encoding="utf-8",
+        )
+        (tmp_path / "items.csv").write_text(
+            "query,max_price\nlaptop,500\n", encoding="utf-8"
+        )
+        return tmp_path
+
+    @pytest.fixture
+    def loader(self, data_dir):
+        """Create a DataLoader reading from the temporary data directory."""
+        return DataLoader(data_dir=data_dir)
+
+    def test_load_many_keeps_order(self, loader):
+        """Test files loaded together come back in the order requested."""
+        json_data, csv_data = loader.load_many(["items.json", "items.csv"])
+
+        assert json_data == {"test_data": [{"query": "shoes", "max_price": 220}]}
+        assert csv_data == [{"query": "laptop", "max_price": "500"}]
+
+    def test_load_many_populates_cache(self, loader):
+        """Test files loaded together are served from the cache afterwards."""
+        loader.load_many(["items.json", "items.csv"])
+
+        assert loader.load_json("items.json") is loader.load_many(["items.json"])[0]
+
+    def test_load_many_missing_file(self, loader):
+        """Test a missing file raises instead of being skipped."""
+        with pytest.raises(FileNotFoundError):
+            loader.load_many(["items.json", "missing.json"])
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_save_json_round_trip(self, loader, monkeypatch, orjson_available):
+        """Test saved JSON loads back unchanged with and without orjson."""
+        monkeypatch.setattr(
+            utils.data_loader,
+            "ORJSON_AVAILABLE",
+            orjson_available and utils.data_loader.ORJSON_AVAILABLE,
+        )
+        data = {"test_data": [{"query": "café", "max_price": 19.99, "tags": None}]}
+
+        loader.save_json(data, "saved.json")
+
+        assert loader.load_json("saved.json", use_cache=False) == data
+
+    def test_disk_cache_shared_between_loaders(self, data_dir, monkeypatch):
+        """Test a second loader reads the pickled result instead of parsing."""
+        DataLoader(data_dir=data_dir, use_disk_cache=True).load_json("items.json")
+        monkeypatch.setattr(
+            utils.data_loader, "_parse_json", Mock(side_effect=AssertionError("parsed"))
+        )
+
+        data = DataLoader(data_dir=data_dir, use_disk_cache=True).load_json("items.json")
+
+        assert data == {"test_data": [{"query": "shoes", "max_price": 220}]}
+
+    def test_disk_cache_misses_after_file_changes(self, data_dir):
+        """Test editing a file invalidates its disk cache entry."""
+        DataLoader(data_dir=data_dir, use_disk_cache=True).load_json("items.json")
+        (data_dir / "items.json").write_text(
+            json.dumps({"test_data": [{"query": "laptop", "max_price": 1500}]}),
+            encoding="utf-8",
+        )
+
+        data = DataLoader(data_dir=data_dir, use_disk_cache=True).load_json("items.json")
+
+        assert data == {"test_data": [{"query": "laptop", "max_price": 1500}]}
+
+    def test_disk_cache_disabled_by_default(self, loader, data_dir):
+        """Test nothing is written to disk unless the cache is enabled."""
+        loader.load_json("items.json")
+
+        assert not (data_dir / utils.data_loader.PARSE_CACHE_DIR).exists()
+
+    def test_get_parameterized_data(self, loader):
+        """Test records become tuples in key order, with None for missing keys."""
+        assert loader.get_parameterized_data("items.json") == [("shoes", 220)]
+        assert loader.get_parameterized_data(
+            "items.json", ["max_price", "limit"]
+        ) == [(220, None)]
+
+    def test_load_csv_matches_dict_reader(self, loader, data_dir):
+        """Test CSV rows, including ragged and blank ones, match csv.DictReader."""
+        content = "query,max_price,limit\nshoes,220,5\nlaptop,500\n\nphone,300,5,extra\n"
+        (data_dir / "ragged.csv").write_text(content, encoding="utf-8")
+
+        expected = list(csv.DictReader(io.StringIO(content)))
+
+        assert loader.load_csv("ragged.csv") == expected
+
+    def test_load_yaml(self, loader, data_dir):
+        """Test YAML files load with the safe schema."""
+        pytest.importorskip("yaml")
+        (data_dir / "items.yaml").write_text(
+            "test_data:\n  - query: café\n    max_price: 220\n", encoding="utf-8"
+        )
+
+        assert loader.load("items.yaml") == {
+            "test_data": [{"query": "café", "max_price": 220}]
+        }
+
+    @pytest.mark.parametrize("env, expected", [("1", True), (None, False)])
+    def test_global_loader_disk_cache_opt_in(self, monkeypatch, env, expected):
+        """Test the shared loader only uses the disk cache when asked to, xdist or not."""
+        monkeypatch.setattr(utils.data_loader, "_data_loader", None)
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+        if env:
+            monkeypatch.setenv("EBAY_DATA_DISK_CACHE", env)
+        else:
+            monkeypatch.delenv("EBAY_DATA_DISK_CACHE", raising=False)
+
+        assert utils.data_loader.get_data_loader().use_disk_cache is expected
@@ -0,0 +1,66 @@
+"""
+Unit tests for the logger utility.
+Tests console coloring and logger setup.
+"""
+
+import logging
+from logging.handlers import QueueHandler
+
+from utils.logger import ColoredFormatter, _file_listeners, setup_logger
+
+
+class TestColoredFormatter:
+    """Test suite for ColoredFormatter."""
+
+    @staticmethod
+    def make_record(level: int = logging.WARNING) -> logging.LogRecord:
+        return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+    def test_colors_level_name(self):
+        """Test the level name is wrapped in its ANSI color."""
+        formatter = ColoredFormatter("%(levelname)s %(message)s", use_color=True)
+
+        assert formatter.format(self.make_record()) == "\033[33mWARNING\033[0m message"
+
+    def test_restores_level_name(self):
+        """Test the record keeps its plain level name for other handlers."""
+        formatter = ColoredFormatter("%(levelname)s", use_color=True)
+        record = self.make_record()
+
+        formatter.format(record)
+
+        assert record.levelname == "WARNING"
+
+    def test_plain_without_color(self):
+        """Test no ANSI codes are added when coloring is disabled."""
+        formatter = ColoredFormatter("%(levelname)s %(message)s", use_color=False)
+
+        assert formatter.format(self.make_record()) == "WARNING message"
+
+    def test_no_color_env_disables_color(self, monkeypatch):
+        """Test NO_COLOR turns coloring off by default."""
+        monkeypatch.setenv("NO_COLOR", "1")
+
+        assert ColoredFormatter().use_color is False
+
+
+class TestSetupLogger:
+    """Test suite for setup_logger."""
+
+    def test_file_logging_goes_through_queue(self, tmp_path):
+        """Test file records are written by the listener, not the logging thread."""
+        logger = setup_logger(
+            "test_queued_file_logger", level="DEBUG", log_to_console=False, log_dir=tmp_path
+        )
+        try:
+            assert [type(h) for h in logger.handlers] == [QueueHandler]
+
+            logger.info("queued %s", "message")
+            listener = _file_listeners.pop()
+            listener.stop()
+            listener.handlers[0].close()
+
+            (log_file,) = tmp_path.glob("test_queued_file_logger_*.log")
+            assert "queued message" in log_file.read_text(encoding="utf-8")
+        finally:
+            logger.handlers.clear()
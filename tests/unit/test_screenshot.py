@@ -0,0 +1,67 @@
+"""
+Unit tests for ScreenshotManager.
+Tests screenshot naming, writes and cleanup.
+"""
+
+import os
+import time
+
+import pytest
+
+from utils.screenshot import ScreenshotManager
+
+
+class TestScreenshotManager:
+    """Test suite for ScreenshotManager."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create a ScreenshotManager writing to a temporary directory."""
+        return ScreenshotManager(output_dir=tmp_path)
+
+    def test_capture_page_writes_through_playwright(self, manager, mock_page):
+        """Test a default capture lets Playwright write the file before returning."""
+        path = manager.capture_page(mock_page, name="home", full_page=True)
+
+        mock_page.screenshot.assert_called_once_with(path=path, full_page=True)
+
+    def test_capture_step_writes_in_background(self, manager, mock_page):
+        """Test step screenshots are written from the returned bytes after flush."""
+        mock_page.screenshot.return_value = b"\x89PNG"
+
+        path = manager.capture_step(mock_page, "search", step_number=2)
+        manager.flush()
+
+        mock_page.screenshot.assert_called_once_with(full_page=False)
+        with open(path, "rb") as f:
+            assert f.read() == b"\x89PNG"
+
+    def test_generate_filename(self, manager):
+        """Test names keep the prefix_name_stamp_counter_suffix layout and stay unique."""
+        first = manager._generate_filename("cart", prefix="FAILURE", suffix="v1")
+        second = manager._generate_filename("cart", prefix="FAILURE", suffix="v1")
+
+        stamp = manager._run_stamp
+        assert first == f"FAILURE_cart_{stamp}_1_v1.png"
+        assert second == f"FAILURE_cart_{stamp}_2_v1.png"
+        assert manager._generate_filename() == f"{stamp}_3.png"
+
+    def test_cleanup_old_screenshots(self, manager, tmp_path):
+        """Test only PNGs older than the cutoff are deleted."""
+        old_png, new_png, old_txt = (
+            tmp_path / "old.png", tmp_path / "new.png", tmp_path / "old.txt"
+        )
+        for path in (old_png, new_png, old_txt):
+            path.write_bytes(b"")
+        ten_days_ago = time.time() - 10 * 86400
+        os.utime(old_png, (ten_days_ago, ten_days_ago))
+        os.utime(old_txt, (ten_days_ago, ten_days_ago))
+
+        assert manager.cleanup_old_screenshots(max_age_days=7) == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["new.png", "old.txt"]
+
+    def test_capture_on_failure_sanitizes_test_name(self, manager, mock_page):
+        """Test parametrized test ids become file-safe names."""
+        path = manager.capture_on_failure(mock_page, "test_search[café-220.0 / 5]")
+
+        assert os.path.basename(path).startswith("FAILURE_test_search_café-220_0___5__")
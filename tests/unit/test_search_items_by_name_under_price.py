@@ -4,34 +4,36 @@ Tests the search, filtering, and pagination functionality.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch, PropertyMock
-from playwright.sync_api import Page, Locator
+from unittest.mock import Mock, patch
 
 from pages.search_results_page import SearchResultsPage, search_items_by_name_under_price
+from tests.unit.fakes import make_page
 
 
 class TestSearchItemsByNameUnderPrice:
     """Unit tests for searchItemsByNameUnderPrice function."""
 
     @pytest.fixture
-    def mock_page(self):
-        """Create a mock Playwright Page object."""
-        page = Mock(spec=Page)
-        page.wait_for_timeout = Mock()
-        page.locator = Mock()
-        return page
+    def mock_page(self, mock_page):
+        """Point the shared mock page at a search results page."""
+        mock_page.url = "https://www.ebay.com/sch/i.html?_nkw=shoes"
+        return mock_page
 
     @pytest.fixture
     def search_page(self, mock_page):
         """Create SearchResultsPage with mocked page."""
-        with patch.object(SearchResultsPage, '_define_locators'):
-            search_page = SearchResultsPage(mock_page)
-            search_page.logger = Mock()
-            search_page.log_action = Mock()
-            search_page.capture_screenshot = Mock()
-            search_page.wait_for_page_load = Mock()
-            search_page.wait_for_network_idle = Mock()
-            return search_page
+        search_page = SearchResultsPage(mock_page)
+        search_page.logger = Mock()
+        search_page.log_action = Mock()
+        search_page.capture_screenshot = Mock()
+        search_page.wait_for_page_load = Mock()
+        search_page.wait_for_dom_ready = Mock()
+        search_page.wait_for_network_idle = Mock()
+        return search_page
+
+    def test_locators_shared_across_instances(self, mock_page):
+        """Test locator table is built once and shared by every instance."""
+        assert SearchResultsPage(mock_page).PRICE_MAX_INPUT is SearchResultsPage(mock_page).PRICE_MAX_INPUT
 
     def test_parse_price_valid_price(self, search_page):
         """Test parsing valid price strings."""
@@ -40,171 +42,239 @@ class TestSearchItemsByNameUnderPrice:
         assert search_page._parse_price("220") == 220.0
         assert search_page._parse_price("$99.99") == 99.99
 
+    def test_parse_price_range_and_exotic_shapes(self, search_page):
+        """Ranges and non-plain dollar text fall back to the regex path."""
+        assert search_page._parse_price("$10.00 to $25.00") == 10.0
+        assert search_page._parse_price("US $45.00") == 45.0
+        assert search_page._parse_price("$1.2.3") == 1.2
+
     def test_parse_price_invalid_price(self, search_page):
         """Test parsing invalid price strings."""
         assert search_page._parse_price("") is None
         assert search_page._parse_price("invalid") is None
         assert search_page._parse_price("$abc") is None
 
+    @staticmethod
+    def _items(prices, start=0):
+        """Build extractor rows as returned by the page.evaluate item extraction."""
+        return [
+            {"href": f"https://ebay.com/item/{start + i}", "priceText": f"${price}"}
+            for i, price in enumerate(prices)
+        ]
+
     def test_search_items_no_results(self, search_page, mock_page):
         """Test search when no items meet criteria."""
-        # Mock empty results
-        mock_items = []
-        mock_locator = Mock()
-        mock_locator.all.return_value = mock_items
-        mock_page.locator.return_value = mock_locator
+        mock_page.evaluate.return_value = []
 
         search_page.is_element_present = Mock(return_value=False)
+        search_page._is_next_page_available = Mock(return_value=False)
+        search_page._apply_price_filter = Mock(return_value=False)
 
         result = search_page.search_items_by_name_under_price("nonexistent", 100, 5)
 
         assert result == []
-        search_page.capture_screenshot.assert_called_once()
 
     def test_search_items_single_page_enough_results(self, search_page, mock_page):
         """Test search finding enough items on first page."""
-        # Create mock items that meet price criteria
-        mock_items = []
-        for i in range(5):
-            item = Mock(spec=Locator)
-            price_elem = Mock()
-            price_elem.is_visible.return_value = True
-            price_elem.text_content.return_value = f"${50 + i * 10}.00"
-
-            link_elem = Mock()
-            link_elem.get_attribute.return_value = f"https://ebay.com/item/{i}"
-
-            item.locator.side_effect = lambda xpath, **kw: price_elem if "price" in xpath else link_elem
-            mock_items.append(item)
-
-        mock_locator = Mock()
-        mock_locator.all.return_value = mock_items
-        mock_page.locator.return_value = mock_locator
+        mock_page.evaluate.return_value = self._items([f"{50 + i * 10}.00" for i in range(5)])
 
         search_page.is_element_present = Mock(return_value=False)  # No price filter
+        search_page._is_next_page_available = Mock(return_value=False)
         search_page._apply_price_filter = Mock(return_value=False)
 
         result = search_page.search_items_by_name_under_price("shoes", 220, 5)
 
         assert len(result) == 5
         assert all(url.startswith("https://ebay.com/item/") for url in result)
+        mock_page.evaluate.assert_called_once()
 
-    def test_search_items_filters_expensive_items(self, search_page, mock_page):
-        """Test that items above max price are filtered out."""
-        # Create mock items with varying prices
-        mock_items = []
-        prices = [50, 150, 250, 100, 300]  # Only first 2 and 4th are under 220
+    def test_extract_items_makes_no_per_item_calls(self, search_page, mock_page):
+        """Extraction is one page.evaluate; no per-item locator or attribute round trips."""
+        mock_page.evaluate.return_value = self._items(["50.00", "60.00", "70.00"])
+
+        result = search_page._extract_items_from_current_page(220, 5, set())
+
+        assert len(result) == 3
+        mock_page.evaluate.assert_called_once()
+        mock_page.locator.assert_not_called()
 
-        for i, price in enumerate(prices):
-            item = Mock(spec=Locator)
-            price_elem = Mock()
-            price_elem.is_visible.return_value = True
-            price_elem.text_content.return_value = f"${price}.00"
+    def test_extract_items_reads_only_what_limit_needs(self, search_page, mock_page):
+        """The extractor is capped to the rows the remaining limit needs."""
+        mock_page.evaluate.return_value = self._items(["50.00", "60.00"])
 
-            link_elem = Mock()
-            link_elem.get_attribute.return_value = f"https://ebay.com/item/{i}"
+        search_page._extract_items_from_current_page(220, 2, set())
 
-            item.locator.side_effect = lambda xpath, price_elem=price_elem, link_elem=link_elem: \
-                price_elem if "price" in xpath else link_elem
-            mock_items.append(item)
+        assert mock_page.evaluate.call_args.args[1] == {"cap": 6, "maxPrice": 220}
 
-        mock_locator = Mock()
-        mock_locator.all.return_value = mock_items
-        mock_page.locator.return_value = mock_locator
+    def test_extract_items_reads_rest_of_page_when_cap_falls_short(self, search_page, mock_page):
+        """When the capped rows are mostly over price, the rest of the page is read."""
+        over = self._items(["500.00"] * 3)
+        mock_page.evaluate.side_effect = [over, over + self._items(["50.00"], start=3)]
+
+        result = search_page._extract_items_from_current_page(220, 1, set())
+
+        assert result == ["https://ebay.com/item/3"]
+        assert [c.args[1]["cap"] for c in mock_page.evaluate.call_args_list] == [3, None]
+
+    def test_search_items_filters_expensive_items(self, search_page, mock_page):
+        """Test that items above max price are filtered out."""
+        # Only first 2 and 4th are under 220
+        mock_page.evaluate.return_value = self._items(["50.00", "150.00", "250.00", "100.00", "300.00"])
 
         search_page.is_element_present = Mock(return_value=False)
+        search_page._is_next_page_available = Mock(return_value=False)
         search_page._apply_price_filter = Mock(return_value=False)
 
         result = search_page.search_items_by_name_under_price("shoes", 220, 5)
 
         # Should return 3 items (prices 50, 150, 100)
-        assert len(result) == 3
+        assert result == ["https://ebay.com/item/0", "https://ebay.com/item/1", "https://ebay.com/item/3"]
 
     def test_search_items_with_pagination(self, search_page, mock_page):
         """Test search with pagination when first page doesn't have enough items."""
-        # First page: 2 items
-        # Second page: 3 items
-        pages_data = [
-            [("50.00", "https://ebay.com/item/1"), ("100.00", "https://ebay.com/item/2")],
-            [("75.00", "https://ebay.com/item/3"), ("125.00", "https://ebay.com/item/4"),
-             ("90.00", "https://ebay.com/item/5")]
+        # First page: 2 items, second page: 3 items
+        mock_page.evaluate.side_effect = [
+            self._items(["50.00", "100.00"]),
+            self._items(["75.00", "125.00", "90.00"], start=2),
         ]
 
-        page_index = [0]  # Track which page we're on
+        search_page.is_element_present = Mock(return_value=False)
+        search_page._apply_price_filter = Mock(return_value=False)
+        search_page._is_next_page_available = Mock(return_value=True)
+        search_page._go_to_next_page = Mock(return_value=True)
+        mock_page.context.new_page.side_effect = Exception("no extra pages")
+
+        result = search_page.search_items_by_name_under_price("shoes", 220, 5)
 
-        def get_items(*args, **kwargs):
-            items = []
-            for price, url in pages_data[page_index[0]]:
-                item = Mock(spec=Locator)
-                price_elem = Mock()
-                price_elem.is_visible.return_value = True
-                price_elem.text_content.return_value = f"${price}"
+        assert len(result) == 5
+        search_page._go_to_next_page.assert_called_once()
+
+    def test_search_items_loads_next_pages_ahead(self, search_page, mock_page):
+        """Later result pages load ahead on extra pages and are extracted in order."""
+        mock_page.evaluate.return_value = self._items(["50.00"])
+        extra_pages = []
+        for start in (1, 3, 5):
+            extra = make_page()
+            extra.evaluate.return_value = self._items(["60.00", "70.00"], start=start)
+            extra_pages.append(extra)
+        mock_page.context.new_page.side_effect = extra_pages
 
-                link_elem = Mock()
-                link_elem.get_attribute.return_value = url
+        search_page.is_element_present = Mock(return_value=False)
+        search_page._apply_price_filter = Mock(return_value=False)
+        search_page._is_next_page_available = Mock(return_value=True)
+        search_page._go_to_next_page = Mock()
+
+        result = search_page.search_items_by_name_under_price("shoes", 220, 4)
+
+        assert result == [f"https://ebay.com/item/{i}" for i in range(4)]
+        search_page._go_to_next_page.assert_not_called()
+        # Pages 2-4 start loading together; the freed page then moves on to page 5
+        loaded = [[c.args[0][-6:] for c in p.goto.call_args_list] for p in extra_pages]
+        assert loaded == [["_pgn=2", "_pgn=5"], ["_pgn=3"], ["_pgn=4"]]
+        extra_pages[2].evaluate.assert_not_called()
+        for extra in extra_pages:
+            extra.close.assert_called_once()
+
+    def test_search_items_dedupes_across_pages(self, search_page, mock_page):
+        """Items repeated on a later page (or within a page) are collected once."""
+        mock_page.evaluate.side_effect = [
+            self._items(["50.00", "60.00"]),
+            self._items(["50.00", "60.00", "70.00"]) + self._items(["70.00"], start=2),
+        ]
 
-                item.locator.side_effect = lambda xpath, pe=price_elem, le=link_elem: \
-                    pe if "price" in xpath else le
-                items.append(item)
+        search_page.is_element_present = Mock(return_value=False)
+        search_page._apply_price_filter = Mock(return_value=False)
+        search_page._is_next_page_available = Mock(return_value=True)
+        search_page._go_to_next_page = Mock(side_effect=[True, False])
+        mock_page.context.new_page.side_effect = Exception("no extra pages")
 
-            mock_loc = Mock()
-            mock_loc.all.return_value = items
-            return mock_loc
+        result = search_page.search_items_by_name_under_price("shoes", 220, 5)
 
-        mock_page.locator.side_effect = get_items
+        assert result == [
+            "https://ebay.com/item/0",
+            "https://ebay.com/item/1",
+            "https://ebay.com/item/2",
+        ]
 
-        # Mock pagination
-        has_next = [True, False]  # Has next page first time, not second time
+    def test_go_to_next_page_follows_href(self, search_page, mock_page):
+        """Pagination navigates straight to the Next link's href instead of clicking."""
+        mock_page.evaluate.return_value = "/sch/i.html?_nkw=shoes&_pgn=2"
+        search_page.navigate = Mock()
+        search_page.click = Mock()
 
-        def mock_has_next_page():
-            return has_next[page_index[0]]
+        assert search_page._go_to_next_page() is True
 
-        def mock_go_to_next():
-            if page_index[0] < len(pages_data) - 1:
-                page_index[0] += 1
-                return True
-            return False
+        search_page.navigate.assert_called_once_with(
+            "https://www.ebay.com/sch/i.html?_nkw=shoes&_pgn=2", wait_until="domcontentloaded"
+        )
+        search_page.click.assert_not_called()
+        search_page.wait_for_network_idle.assert_not_called()
+        # Availability and href come from the same single probe
+        mock_page.evaluate.assert_called_once()
 
-        search_page.is_element_present = Mock(return_value=False)
-        search_page._apply_price_filter = Mock(return_value=False)
-        search_page._has_next_page = Mock(side_effect=mock_has_next_page)
-        search_page._go_to_next_page = Mock(side_effect=mock_go_to_next)
+    def test_go_to_next_page_clicks_without_href(self, search_page, mock_page):
+        """Pagination falls back to clicking Next when the link has no href."""
+        mock_page.evaluate.return_value = ""
+        search_page.navigate = Mock()
+        search_page.click = Mock()
 
-        result = search_page.search_items_by_name_under_price("shoes", 220, 5)
+        assert search_page._go_to_next_page() is True
 
-        assert len(result) == 5
-        assert search_page._go_to_next_page.called
+        search_page.navigate.assert_not_called()
+        search_page.click.assert_called_once_with(search_page.NEXT_PAGE_BUTTON)
 
     def test_search_items_stops_at_limit(self, search_page, mock_page):
         """Test that search stops when reaching the requested limit."""
-        # Create 10 items but only request 3
-        mock_items = []
-        for i in range(10):
-            item = Mock(spec=Locator)
-            price_elem = Mock()
-            price_elem.is_visible.return_value = True
-            price_elem.text_content.return_value = f"${50 + i * 10}.00"
+        # 10 items available but only 3 requested
+        mock_page.evaluate.return_value = self._items([f"{50 + i * 10}.00" for i in range(10)])
 
-            link_elem = Mock()
-            link_elem.get_attribute.return_value = f"https://ebay.com/item/{i}"
+        search_page.is_element_present = Mock(return_value=False)
+        search_page._is_next_page_available = Mock(return_value=False)
+        search_page._apply_price_filter = Mock(return_value=False)
 
-            item.locator.side_effect = lambda xpath, **kw: price_elem if "price" in xpath else link_elem
-            mock_items.append(item)
+        result = search_page.search_items_by_name_under_price("shoes", 220, 3)
 
-        mock_locator = Mock()
-        mock_locator.all.return_value = mock_items
-        mock_page.locator.return_value = mock_locator
+        assert len(result) == 3
 
-        search_page.is_element_present = Mock(return_value=False)
+    def test_search_screenshots_are_opt_in(self, search_page, mock_page):
+        """Success-path screenshots are skipped unless enabled; error capture stays."""
+        mock_page.evaluate.return_value = self._items(["50.00"])
         search_page._apply_price_filter = Mock(return_value=False)
 
+        with patch("pages.search_results_page.settings.REPORT.screenshot_on_success", False):
+            search_page.search_items_by_name_under_price("shoes", 220, 1)
+        search_page.capture_screenshot.assert_not_called()
+
+        with patch("pages.search_results_page.settings.REPORT.screenshot_on_success", True):
+            search_page.search_items_by_name_under_price("shoes", 220, 1)
+        assert search_page.capture_screenshot.call_count == 2
+
+    def test_search_skips_price_filter_when_first_page_is_enough(self, search_page, mock_page):
+        """No filter reload when the unfiltered first page already meets the limit."""
+        mock_page.evaluate.return_value = self._items(["50.00", "300.00", "60.00"])
+        search_page._apply_price_filter = Mock(return_value=True)
+
+        result = search_page.search_items_by_name_under_price("shoes", 220, 2)
+
+        assert result == ["https://ebay.com/item/0", "https://ebay.com/item/2"]
+        search_page._apply_price_filter.assert_not_called()
+
+    def test_search_applies_price_filter_when_first_page_falls_short(self, search_page, mock_page):
+        """The filtered page is extracted on top of what the first page gave."""
+        mock_page.evaluate.side_effect = [
+            self._items(["50.00", "300.00"]),
+            self._items(["50.00", "60.00", "70.00"], start=0),
+        ]
+        search_page._apply_price_filter = Mock(return_value=True)
+
         result = search_page.search_items_by_name_under_price("shoes", 220, 3)
 
-        assert len(result) == 3
+        assert result == [f"https://ebay.com/item/{i}" for i in range(3)]
+        search_page._apply_price_filter.assert_called_once_with(220)
 
     def test_search_items_applies_price_filter(self, search_page):
         """Test that price filter is applied when available."""
-        search_page.is_element_present = Mock(return_value=True)
+        search_page.is_element_in_dom = Mock(return_value=True)
         search_page.fill = Mock()
         search_page.click = Mock()
         search_page.wait_for_page_load = Mock()
@@ -215,50 +285,124 @@ class TestSearchItemsByNameUnderPrice:
         assert result is True
         search_page.fill.assert_called_once()
         search_page.click.assert_called_once()
+        search_page.wait_for_network_idle.assert_not_called()
+
+    def test_search_items_waits_for_results_not_network_idle(self, search_page, mock_page):
+        """The search waits for the first result item instead of network idle."""
+        mock_page.evaluate.return_value = self._items(["50.00"])
+        search_page._apply_price_filter = Mock(return_value=False)
+
+        search_page.search_items_by_name_under_price("shoes", 220, 1)
+
+        search_page.wait_for_dom_ready.assert_called_once()
+        mock_page.locator.assert_any_call("li.s-item")
+        mock_page.locator.return_value.first.wait_for.assert_called_with(state="attached", timeout=15000)
+        search_page.wait_for_network_idle.assert_not_called()
 
     def test_search_items_no_price_filter_available(self, search_page):
         """Test behavior when price filter is not available."""
-        search_page.is_element_present = Mock(return_value=False)
+        search_page.is_element_in_dom = Mock(return_value=False)
 
         result = search_page._apply_price_filter(220)
 
         assert result is False
 
-    def test_standalone_function(self, mock_page):
+    def test_next_page_probe_is_one_evaluate(self, search_page, mock_page):
+        """The next-page check is a single DOM probe that ignores a disabled link."""
+        search_page.is_element_present = Mock()
+        mock_page.evaluate.return_value = None
+
+        assert search_page._is_next_page_available() is False
+
+        mock_page.evaluate.assert_called_once()
+        assert "aria-disabled" in mock_page.evaluate.call_args.args[0]
+        search_page.is_element_present.assert_not_called()
+
+    def test_search_skips_home_setup_once_session_initialized(self, search_page, mock_page):
+        """From another eBay page, a later search goes straight to the header search."""
+        mock_page.url = "https://www.ebay.com/itm/123"
+        mock_page.evaluate.return_value = self._items(["50.00"])
+        search_page._apply_price_filter = Mock(return_value=False)
+
+        with patch("pages.home_page.HomePage") as MockHomePage:
+            search_page.search_items_by_name_under_price("shoes", 220, 1)
+            search_page.search_items_by_name_under_price("boots", 220, 1)
+
+        home = MockHomePage.return_value
+        home.navigate.assert_called_once()
+        home.identification.assert_called_once()
+        assert [c.args[0] for c in home.search.call_args_list] == ["shoes", "boots"]
+
+    def test_search_repeats_home_setup_after_failed_identification(self, search_page, mock_page):
+        """A failed identification does not mark the context as initialized."""
+        mock_page.url = "https://www.ebay.com/itm/123"
+        mock_page.evaluate.return_value = self._items(["50.00"])
+        search_page._apply_price_filter = Mock(return_value=False)
+
+        with patch("pages.home_page.HomePage") as MockHomePage:
+            MockHomePage.return_value.identification.side_effect = [False, True]
+            search_page.search_items_by_name_under_price("shoes", 220, 1)
+            search_page.search_items_by_name_under_price("boots", 220, 1)
+            search_page.search_items_by_name_under_price("hats", 220, 1)
+
+        assert MockHomePage.return_value.navigate.call_count == 2
+
+    def test_search_initializes_each_context(self, search_page, mock_page):
+        """A page in a new browser context opens the home page again."""
+        mock_page.url = "https://www.ebay.com/itm/123"
+        mock_page.evaluate.return_value = self._items(["50.00"])
+        search_page._apply_price_filter = Mock(return_value=False)
+
+        with patch("pages.home_page.HomePage") as MockHomePage:
+            search_page.search_items_by_name_under_price("shoes", 220, 1)
+            mock_page.context = Mock()
+            search_page.search_items_by_name_under_price("boots", 220, 1)
+
+        assert MockHomePage.return_value.navigate.call_count == 2
+
+    def test_has_results_counts_rows_without_waiting(self, search_page, mock_page):
+        """Test rendered result rows answer has_results without the no-results wait."""
+        search_page.is_element_present = Mock(return_value=True)
+        mock_page.locator.return_value.count.return_value = 12
+
+        assert search_page.has_results() is True
+        mock_page.locator.assert_called_once_with("li.s-item")
+        search_page.is_element_present.assert_not_called()
+
+        mock_page.locator.return_value.count.return_value = 0
+        assert search_page.has_results() is False
+        search_page.is_element_present.assert_called_once_with(search_page.NO_RESULTS, timeout=2000)
+
+    def test_standalone_function(self, mock_page, monkeypatch):
         """Test the standalone function wrapper."""
-        with patch('pages.search_results_page.SearchResultsPage') as MockSearchPage:
-            mock_instance = Mock()
-            mock_instance.search_items_by_name_under_price.return_value = ["url1", "url2"]
-            MockSearchPage.return_value = mock_instance
+        calls = []
+
+        class FakeSearchResultsPage(SearchResultsPage):
+            def search_items_by_name_under_price(self, query, max_price, limit=10):
+                calls.append((self.page, query, max_price, limit))
+                return ["url1", "url2"]
 
-            result = search_items_by_name_under_price(mock_page, "shoes", 220, 5)
+        monkeypatch.setattr('pages.search_results_page.SearchResultsPage', FakeSearchResultsPage)
 
-            assert result == ["url1", "url2"]
-            mock_instance.search_items_by_name_under_price.assert_called_once_with("shoes", 220, 5)
+        result = search_items_by_name_under_price(mock_page, "shoes", 220, 5)
+
+        assert result == ["url1", "url2"]
+        assert calls == [(mock_page, "shoes", 220, 5)]
 
     def test_search_handles_exceptions_gracefully(self, search_page, mock_page):
         """Test that search handles exceptions and returns partial results."""
-        # First item succeeds, second raises exception
-        item1 = Mock(spec=Locator)
-        price_elem1 = Mock()
-        price_elem1.is_visible.return_value = True
-        price_elem1.text_content.return_value = "$50.00"
-        link_elem1 = Mock()
-        link_elem1.get_attribute.return_value = "https://ebay.com/item/1"
-        item1.locator.side_effect = lambda xpath, **kw: price_elem1 if "price" in xpath else link_elem1
-
-        item2 = Mock(spec=Locator)
-        item2.locator.side_effect = Exception("Simulated error")
-
-        mock_locator = Mock()
-        mock_locator.all.return_value = [item1, item2]
-        mock_page.locator.return_value = mock_locator
+        # First page extracts fine, extraction on the second page fails
+        mock_page.evaluate.side_effect = [
+            self._items(["50.00"], start=1),
+            Exception("Simulated error"),
+        ]
 
         search_page.is_element_present = Mock(return_value=False)
         search_page._apply_price_filter = Mock(return_value=False)
+        search_page._is_next_page_available = Mock(return_value=True)
+        search_page._go_to_next_page = Mock(side_effect=[True, False])
 
         result = search_page.search_items_by_name_under_price("shoes", 220, 5)
 
-        # Should still return the first item despite second item error
-        assert len(result) == 1
-        assert result[0] == "https://ebay.com/item/1"
+        # Should still return the first item despite second page error
+        assert result == ["https://ebay.com/item/1"]
@@ -2,21 +2,29 @@
 Contains helper functions and utility classes.
 """
 
-from .data_loader import (
-    DataLoader,
-    TestDataRecord,
-    get_data_loader,
-    load_csv,
-    load_json,
-    load_test_data,
-)
-from .logger import LoggerMixin, get_logger, init_logging, setup_logger
-from .screenshot import (
-    ScreenshotManager,
-    capture_failure_screenshot,
-    capture_screenshot,
-    get_screenshot_manager,
-)
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# utils.allure_helper does not pull in the data loader and screenshot modules
+_LAZY_ATTRS = {
+    # Logger
+    "setup_logger": ".logger",
+    "get_logger": ".logger",
+    "init_logging": ".logger",
+    "LoggerMixin": ".logger",
+    # Data Loader
+    "DataLoader": ".data_loader",
+    "TestDataRecord": ".data_loader",
+    "get_data_loader": ".data_loader",
+    "load_test_data": ".data_loader",
+    "load_json": ".data_loader",
+    "load_csv": ".data_loader",
+    # Screenshot
+    "ScreenshotManager": ".screenshot",
+    "get_screenshot_manager": ".screenshot",
+    "capture_screenshot": ".screenshot",
+    "capture_failure_screenshot": ".screenshot",
+}
 
 __all__ = [
     # Logger
@@ -37,3 +45,16 @@ __all__ = [
     "capture_screenshot",
     "capture_failure_screenshot",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
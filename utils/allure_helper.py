@@ -1,6 +1,9 @@
 import functools
+import io
+import json
+import zipfile
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, List, Tuple
 
 try:
     import allure
@@ -24,6 +27,22 @@ except ImportError:
         MINOR = "minor"
         TRIVIAL = "trivial"
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Severity level names accepted by AllureHelper.severity
+_SEVERITIES = {
+    "blocker": Severity.BLOCKER,
+    "critical": Severity.CRITICAL,
+    "normal": Severity.NORMAL,
+    "minor": Severity.MINOR,
+    "trivial": Severity.TRIVIAL,
+}
+
 
 class AllureHelper:
     """Helper class for Allure reporting."""
@@ -42,14 +61,12 @@ class AllureHelper:
         """
         if not ALLURE_AVAILABLE:
             return
-        path = Path(screenshot_path)
-        if path.exists():
-            with open(path, "rb") as f:
-                allure.attach(
-                    f.read(),
-                    name=name,
-                    attachment_type=AttachmentType.PNG,
-                )
+        # One open+read; a missing file is skipped instead of pre-checked
+        try:
+            data = Path(screenshot_path).read_bytes()
+        except OSError:
+            return
+        allure.attach(data, name=name, attachment_type=AttachmentType.PNG)
 
     @staticmethod
     def attach_text(name: str, text: str) -> None:
@@ -72,11 +89,33 @@ class AllureHelper:
         if not ALLURE_AVAILABLE:
             return
 
-        import json
+        # Encoded exactly once, and only when Allure will keep it
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        else:
+            body = json.dumps(data, indent=2, default=str)
+        allure.attach(body, name=name, attachment_type=AttachmentType.JSON)
+
+    @staticmethod
+    def attach_zip(files: List[Tuple[str, bytes]], name: str = "Attachments") -> None:
+        """Bundle in-memory files into a single zip attachment.
+
+        Args:
+            files: (filename, content) pairs
+            name: The name of the attachment.
+        """
+        if not ALLURE_AVAILABLE or not files:
+            return
 
-        allure.attach(
-            json.dumps(data, indent=2), name=name, attachment_type=AttachmentType.JSON
-        )
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            for filename, content in files:
+                archive.writestr(filename, content)
+        allure.attach(buffer.getvalue(), name=name, extension="zip")
 
     @staticmethod
     def attach_html(html: str, name: str = "HTML Content") -> None:
@@ -147,14 +186,7 @@ class AllureHelper:
     def severity(level: str):
         """Set test severity."""
         if ALLURE_AVAILABLE:
-            severity_map = {
-                "blocker": Severity.BLOCKER,
-                "critical": Severity.CRITICAL,
-                "normal": Severity.NORMAL,
-                "minor": Severity.MINOR,
-                "trivial": Severity.TRIVIAL,
-            }
-            return allure.severity(severity_map.get(level.lower(), Severity.NORMAL))
+            return allure.severity(_SEVERITIES.get(level.lower(), Severity.NORMAL))
         return lambda f: f
 
     @staticmethod
@@ -190,13 +222,10 @@ class AllureHelper:
         """
 
         def decorator(func: Callable) -> Callable:
-            @functools.wraps(func)
-            def wrapper(*args: Any, **kwargs: Any) -> Any:
-                if ALLURE_AVAILABLE:
-                    allure.severity(level)
-                return func(*args, **kwargs)
-
-            return wrapper
+            # Marked once at decoration time; the test itself runs unwrapped
+            if ALLURE_AVAILABLE:
+                return allure.severity(level)(func)
+            return func
 
         return decorator
 
@@ -212,12 +241,14 @@ def allure_step(name: str):
     """
 
     def decorator(func: Callable) -> Callable:
+        # Without Allure there is nothing to record; skip the wrapper frame
+        if not ALLURE_AVAILABLE:
+            return func
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            if ALLURE_AVAILABLE:
-                with allure.step(name):
-                    return func(*args, **kwargs)
-            return func(*args, **kwargs)
+            with allure.step(name):
+                return func(*args, **kwargs)
 
         return wrapper
 
@@ -3,14 +3,31 @@ Data Loader Utility
 """
 
 import csv
+import hashlib
 import json
 import logging
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from config.settings import settings
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Upper bound on files read concurrently by DataLoader.load_many
+MAX_PARALLEL_LOADS = 32
+
+# Directory under data_dir holding pickled parse results (see use_disk_cache)
+PARSE_CACHE_DIR = ".parse_cache"
+
 
 @dataclass
 class TestDataRecord:
@@ -31,16 +48,61 @@ class TestDataRecord:
         return key in self.data
 
 
+def _parse_json(filepath: Path) -> Union[Dict, List]:
+    """Parse a JSON file, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _csv_records(reader) -> List[Dict[str, Any]]:
+    """
+    Turn csv.reader rows into dicts keyed by the header row.
+
+    Same result as list(csv.DictReader(...)), without DictReader's per-row
+    Python __next__: full-width rows go straight through dict(zip()).
+    """
+    header = next(reader, None)
+    if header is None:
+        return []
+
+    width = len(header)
+    records = []
+    for row in reader:
+        if len(row) == width:
+            records.append(dict(zip(header, row)))
+        elif row:
+            # Ragged rows follow DictReader: missing fields are None and
+            # extra fields are collected in a list under the None key
+            record = dict(zip(header, row))
+            if len(row) > width:
+                record[None] = row[width:]
+            else:
+                record.update(dict.fromkeys(header[len(row):]))
+            records.append(record)
+    return records
+
+
 class DataLoader:
     """
     Loads test data from various file formats.
     Supports JSON, CSV, and YAML files.
     """
 
-    def __init__(self, data_dir: Path = None, logger: logging.Logger = None):
+    def __init__(
+        self,
+        data_dir: Path = None,
+        logger: logging.Logger = None,
+        use_disk_cache: bool = False,
+    ):
         self.data_dir = data_dir or settings.DATA_DIR
         self.logger = logger or logging.getLogger(__name__)
         self._cache: Dict[str, Any] = {}
+        # Parsed files are also pickled to disk, so other processes (xdist
+        # workers, later runs) skip parsing until the file changes
+        self.use_disk_cache = use_disk_cache
 
     def _resolve_path(self, filename: str) -> Path:
         """Resolve file path, checking data directory if not absolute."""
@@ -60,25 +122,9 @@ class DataLoader:
         Returns:
             Parsed JSON data (dict or list)
         """
-        filepath = self._resolve_path(filename)
-        cache_key = f"json:{filepath}"
-
-        if use_cache and cache_key in self._cache:
-            self.logger.debug(f"Using cached JSON data: {filepath}")
-            return self._cache[cache_key]
-
-        self.logger.info(f"Loading JSON file: {filepath}")
-
-        if not filepath.exists():
-            raise FileNotFoundError(f"JSON file not found: {filepath}")
-
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if use_cache:
-            self._cache[cache_key] = data
-
-        return data
+        return self._load_parsed(
+            self._resolve_path(filename), "json", _parse_json, use_cache
+        )
 
     def load_csv(
         self, filename: str, delimiter: str = ",", use_cache: bool = True
@@ -94,27 +140,13 @@ class DataLoader:
         Returns:
             List of dictionaries (one per row)
         """
-        filepath = self._resolve_path(filename)
-        cache_key = f"csv:{filepath}"
-
-        if use_cache and cache_key in self._cache:
-            self.logger.debug(f"Using cached CSV data: {filepath}")
-            return self._cache[cache_key]
+        def parse_csv(filepath: Path) -> List[Dict[str, str]]:
+            with open(filepath, "r", encoding="utf-8", newline="") as f:
+                return _csv_records(csv.reader(f, delimiter=delimiter))
 
-        self.logger.info(f"Loading CSV file: {filepath}")
-
-        if not filepath.exists():
-            raise FileNotFoundError(f"CSV file not found: {filepath}")
-
-        data = []
-        with open(filepath, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            data = list(reader)
-
-        if use_cache:
-            self._cache[cache_key] = data
-
-        return data
+        return self._load_parsed(
+            self._resolve_path(filename), "csv", parse_csv, use_cache
+        )
 
     def load_yaml(self, filename: str, use_cache: bool = True) -> Union[Dict, List]:
         """
@@ -134,26 +166,94 @@ class DataLoader:
                 "PyYAML is required for YAML support. Install with: pip install pyyaml"
             )
 
-        filepath = self._resolve_path(filename)
-        cache_key = f"yaml:{filepath}"
+        # libyaml's C loader when PyYAML was built with it; same safe schema
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        def parse_yaml(filepath: Path) -> Union[Dict, List]:
+            with open(filepath, "rb") as f:
+                return yaml.load(f.read(), Loader=loader)
+
+        return self._load_parsed(
+            self._resolve_path(filename), "yaml", parse_yaml, use_cache
+        )
+
+    def _load_parsed(
+        self,
+        filepath: Path,
+        kind: str,
+        parse: Callable[[Path], Any],
+        use_cache: bool,
+    ) -> Any:
+        """
+        Load a data file through the in-memory and (optional) on-disk caches.
+
+        Args:
+            filepath: Resolved path to the data file
+            kind: Format name, used in cache keys and log messages
+            parse: Reads and parses the file
+            use_cache: Whether to use cached data
+
+        Returns:
+            Parsed data
+        """
+        cache_key = f"{kind}:{filepath}"
 
         if use_cache and cache_key in self._cache:
-            self.logger.debug(f"Using cached YAML data: {filepath}")
+            self.logger.debug(f"Using cached {kind.upper()} data: {filepath}")
             return self._cache[cache_key]
 
-        self.logger.info(f"Loading YAML file: {filepath}")
+        self.logger.info(f"Loading {kind.upper()} file: {filepath}")
 
         if not filepath.exists():
-            raise FileNotFoundError(f"YAML file not found: {filepath}")
+            raise FileNotFoundError(f"{kind.upper()} file not found: {filepath}")
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        cache_file = self._disk_cache_file(cache_key, filepath) if use_cache else None
+        data = self._read_disk_cache(cache_file)
+        if data is None:
+            data = parse(filepath)
+            self._write_disk_cache(cache_file, data)
 
         if use_cache:
             self._cache[cache_key] = data
 
         return data
 
+    def _disk_cache_file(self, cache_key: str, filepath: Path) -> Optional[Path]:
+        """Get the pickle path for this version of a file; None if disabled."""
+        if not self.use_disk_cache:
+            return None
+        # mtime and size are part of the key, so edited files miss the cache
+        stat = filepath.stat()
+        key = f"{cache_key}:{stat.st_mtime_ns}:{stat.st_size}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.data_dir / PARSE_CACHE_DIR / f"{digest}.pickle"
+
+    def _read_disk_cache(self, cache_file: Optional[Path]) -> Any:
+        """Load a pickled parse result; None on a miss or unreadable entry."""
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, "rb") as f:
+                data = pickle.load(f)
+            self.logger.debug(f"Using disk-cached data: {cache_file}")
+            return data
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable parse cache {cache_file}: {e}")
+            return None
+
+    def _write_disk_cache(self, cache_file: Optional[Path], data: Any) -> None:
+        """Pickle a parse result, replacing the entry atomically."""
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            self.logger.debug(f"Could not write parse cache {cache_file}: {e}")
+
     def load(self, filename: str, use_cache: bool = True) -> Union[Dict, List]:
         """
         Load data from file, automatically detecting format by extension.
@@ -179,6 +279,31 @@ class DataLoader:
             case _:
                 raise ValueError(f"Unsupported file format: {extension}")
 
+    def load_many(
+        self, filenames: List[str], use_cache: bool = True
+    ) -> List[Union[Dict, List]]:
+        """
+        Load several data files, reading them concurrently.
+
+        File reads release the GIL, so N files cost roughly the slowest read
+        plus parsing instead of the sum of every read.
+
+        Args:
+            filenames: Paths to data files, in any supported format
+            use_cache: Whether to use cached data
+
+        Returns:
+            Parsed data, in the same order as filenames
+        """
+        if len(filenames) <= 1:
+            return [self.load(filename, use_cache) for filename in filenames]
+
+        workers = min(MAX_PARALLEL_LOADS, len(filenames))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda filename: self.load(filename, use_cache), filenames)
+            )
+
     def load_test_data(
         self, filename: str, use_cache: bool = True
     ) -> List[TestDataRecord]:
@@ -192,15 +317,7 @@ class DataLoader:
         Returns:
             List of TestDataRecord objects
         """
-        raw_data = self.load(filename, use_cache)
-
-        # Ensure data is a list
-        if isinstance(raw_data, dict):
-            if "test_data" in raw_data:
-                raw_data = raw_data["test_data"]
-            else:
-                raw_data = [raw_data]
-
+        raw_data = self._load_records(filename, use_cache)
         filepath = str(self._resolve_path(filename))
 
         return [
@@ -208,6 +325,17 @@ class DataLoader:
             for idx, record in enumerate(raw_data)
         ]
 
+    def _load_records(self, filename: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """Load a data file as a list of plain record dicts."""
+        raw_data = self.load(filename, use_cache)
+
+        # Ensure data is a list
+        if isinstance(raw_data, dict):
+            if "test_data" in raw_data:
+                return raw_data["test_data"]
+            return [raw_data]
+        return raw_data
+
     def get_parameterized_data(
         self, filename: str, param_keys: List[str] = None
     ) -> List[tuple]:
@@ -221,15 +349,16 @@ class DataLoader:
         Returns:
             List of tuples for parametrize
         """
-        records = self.load_test_data(filename)
+        # Plain dicts: the TestDataRecord wrappers add nothing to a tuple
+        records = self._load_records(filename)
 
         if not records:
             return []
 
         if param_keys is None:
-            param_keys = list(records[0].data.keys())
+            param_keys = list(records[0].keys())
 
-        return [tuple(record.get(key) for key in param_keys) for record in records]
+        return [tuple(map(record.get, param_keys)) for record in records]
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
@@ -253,8 +382,17 @@ class DataLoader:
         filepath = self._resolve_path(filename)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        # orjson only knows two-space indentation; other widths use stdlib json
+        if ORJSON_AVAILABLE and indent == 2:
+            with open(filepath, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
 
         self.logger.info(f"Saved JSON data to: {filepath}")
         return filepath
@@ -268,7 +406,10 @@ def get_data_loader() -> DataLoader:
     """Get or create global data loader instance."""
     global _data_loader
     if _data_loader is None:
-        _data_loader = DataLoader()
+        # Off by default: for small data files stat + hash + pickle I/O costs
+        # about as much as parsing. EBAY_DATA_DISK_CACHE=1 shares parse results
+        # of large files across xdist workers
+        _data_loader = DataLoader(use_disk_cache=os.getenv("EBAY_DATA_DISK_CACHE", "0") == "1")
     return _data_loader
 
 
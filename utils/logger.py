@@ -3,13 +3,30 @@ Logger Utility
 Configures and provides logging functionality for the framework.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import List
 
 from config.settings import settings
 
+# Background threads draining each logger's queue into its log file
+_file_listeners: List[QueueListener] = []
+
+
+def _stop_file_listeners() -> None:
+    """Flush queued records to their log files and stop the listeners."""
+    while _file_listeners:
+        _file_listeners.pop().stop()
+
+
+atexit.register(_stop_file_listeners)
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colored output for console."""
@@ -23,14 +40,33 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
-    def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
+    def __init__(self, *args, use_color: bool = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colors only help on a terminal; redirected output and NO_COLOR stay plain
+        if use_color is None:
+            use_color = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+        self.use_color = use_color
+
+        # Colored level names, built once instead of per record
         reset = self.COLORS["RESET"]
+        self._colored_levels = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != "RESET"
+        }
 
-        # Add color to level name
-        record.levelname = f"{color}{record.levelname}{reset}"
+    def format(self, record: logging.LogRecord) -> str:
+        if not self.use_color:
+            return super().format(record)
 
-        return super().format(record)
+        # Color the level name for this handler only; other handlers
+        # (e.g. the log file) see the same record afterwards
+        levelname = record.levelname
+        record.levelname = self._colored_levels.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logger(
@@ -85,7 +121,13 @@ def setup_logger(
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(settings.LOG_FORMAT)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        # The test thread only enqueues; a listener thread does the file writes
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _file_listeners.append(listener)
+        logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
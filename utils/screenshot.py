@@ -2,15 +2,72 @@
 Provides screenshot capture and management functionality.
 """
 
+import atexit
 import logging
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from playwright.sync_api import Locator, Page
 
 from config.settings import settings
 
+# Threads used to delete stale screenshots in cleanup_old_screenshots
+CLEANUP_WORKERS = 16
+
+# Anything but alphanumerics (str.isalnum), "_" and "-" becomes "_" in file names
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w-]")
+
+
+class _ScreenshotWriter:
+    """
+    Writes captured PNG bytes to disk on a daemon thread.
+
+    Lets a step screenshot return as soon as the browser has encoded it,
+    instead of also waiting for the file write.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Tuple[Path, bytes]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def submit(self, filepath: Path, data: bytes) -> None:
+        """Queue data to be written to filepath."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="screenshot-writer", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((filepath, data))
+
+    def flush(self) -> None:
+        """Block until every queued screenshot is on disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            filepath, data = self._queue.get()
+            try:
+                filepath.write_bytes(data)
+            except OSError as e:
+                self.logger.error(f"Failed to write screenshot {filepath}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+_writer = _ScreenshotWriter()
+atexit.register(_writer.flush)
+
 
 class ScreenshotManager:
     """
@@ -21,6 +78,8 @@ class ScreenshotManager:
         self.output_dir = output_dir or settings.SCREENSHOTS_DIR
         self.logger = logger or logging.getLogger(__name__)
         self._counter = 0
+        # Formatted once; the counter keeps names from this manager unique
+        self._run_stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
 
         # Ensure directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -30,19 +89,16 @@ class ScreenshotManager:
     ) -> str:
         """Generate unique filename for screenshot."""
         self._counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
 
-        parts = []
-        if prefix:
-            parts.append(prefix)
+        filename = f"{self._run_stamp}_{self._counter}"
         if name:
-            parts.append(name)
-        parts.append(timestamp)
-        parts.append(str(self._counter))
+            filename = f"{name}_{filename}"
+        if prefix:
+            filename = f"{prefix}_{filename}"
         if suffix:
-            parts.append(suffix)
+            filename = f"{filename}_{suffix}"
 
-        return "_".join(parts) + ".png"
+        return f"{filename}.png"
 
     def capture_page(
         self,
@@ -51,18 +107,27 @@ class ScreenshotManager:
         full_page: bool = False,
         prefix: str = "",
         suffix: str = "",
+        wait: bool = True,
     ) -> str:
         """
         Capture screenshot of the entire page.
 
+        Args:
+            wait: Write the file before returning. With False the file is
+                written in the background; call flush() before reading it.
+
         Returns:
             Path to saved screenshot
         """
         filename = self._generate_filename(name, prefix, suffix)
         filepath = self.output_dir / filename
 
-        page.screenshot(path=str(filepath), full_page=full_page)
-        self.logger.info(f"Page screenshot saved: {filepath}")
+        if wait:
+            page.screenshot(path=str(filepath), full_page=full_page)
+            self.logger.info(f"Page screenshot saved: {filepath}")
+        else:
+            _writer.submit(filepath, page.screenshot(full_page=full_page))
+            self.logger.info(f"Page screenshot queued: {filepath}")
 
         return str(filepath)
 
@@ -91,7 +156,7 @@ class ScreenshotManager:
         Path to saved screenshot
         """
         # Sanitize test name for filename
-        safe_name = "".join(c if c.isalnum() or c in "_-" else "_" for c in test_name)
+        safe_name = _UNSAFE_NAME_CHARS.sub("_", test_name)
 
         filepath = self.capture_page(
             page, name=safe_name, prefix="FAILURE", full_page=True
@@ -112,7 +177,12 @@ class ScreenshotManager:
 
         """
         prefix = f"step_{step_number}" if step_number else "step"
-        return self.capture_page(page, name=step_name, prefix=prefix)
+        # Step screenshots are not read back during the test
+        return self.capture_page(page, name=step_name, prefix=prefix, wait=False)
+
+    def flush(self) -> None:
+        """Wait for screenshots captured with wait=False to be written."""
+        _writer.flush()
 
     def get_screenshots_dir(self) -> Path:
         """Get the screenshots directory path."""
@@ -122,20 +192,34 @@ class ScreenshotManager:
         """
         Number of deleted files
         """
-        from datetime import timedelta
+        self.flush()
+        cutoff_ns = time.time_ns() - max_age_days * 86400 * 10**9
 
-        cutoff = datetime.now() - timedelta(days=max_age_days)
-        deleted_count = 0
+        # scandir entries carry the directory listing, so no separate glob pass
+        with os.scandir(self.output_dir) as entries:
+            stale = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".png")
+                and entry.stat().st_mtime_ns < cutoff_ns
+            ]
 
-        for filepath in self.output_dir.glob("*.png"):
-            if filepath.stat().st_mtime < cutoff.timestamp():
-                filepath.unlink()
-                deleted_count += 1
+        with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+            deleted_count = sum(executor.map(_unlink_if_present, stale))
 
         self.logger.info(f"Cleaned up {deleted_count} old screenshots")
         return deleted_count
 
 
+def _unlink_if_present(path: str) -> bool:
+    """Delete a file; False if another process removed it first."""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
 # Global screenshot manager
 _screenshot_manager: Optional[ScreenshotManager] = None
 